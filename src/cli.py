@@ -4,10 +4,14 @@ import argparse
 from pathlib import Path
 
 from src.config import load_app_config, load_repo_specs
-from src.devpost import load_submissions
-from src.ingest import ingest_repo
+from src.devpost import Submission, load_submissions
+from src.ingest import iter_ingest, iter_ingest_and_analyze
+from src.models import RepoSpec
 from src.report import analyze_genai_optional, build_team_report, write_reports
-from src.temporal import analyze_repo
+
+DEFAULT_JOBS = 8
+
+SubmissionIndex = tuple[dict[str, Submission], dict[str, Submission]]
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -16,6 +20,29 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--config", required=True, help="Hackathon config YAML")
     parser.add_argument("--github-token", default=None, help="GitHub token override")
     parser.add_argument("--gitlab-token", default=None, help="GitLab token override")
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help=f"Number of repos to ingest concurrently (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Keep bare clones in this directory and refresh them with git fetch "
+            "on later runs instead of re-cloning"
+        ),
+    )
+    parser.add_argument(
+        "--include-files",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Collect changed file paths per commit "
+            "(default: on with --analyze/--report, which need them)"
+        ),
+    )
     parser.add_argument(
         "--analyze",
         action="store_true",
@@ -43,17 +70,25 @@ def main() -> int:
     total_commits = 0
     total_errors = 0
     reports = []
-    submission_map = _load_submission_map(args.input)
-
-    for spec in specs:
-        result = ingest_repo(
-            spec,
-            github_token=args.github_token,
-            gitlab_token=args.gitlab_token,
-        )
+    submission_index = _index_submissions(_load_submission_map(args.input))
+
+    include_files = args.include_files
+    if include_files is None:
+        include_files = args.analyze or args.report
+    ingest_options = {
+        "max_workers": args.jobs,
+        "github_token": args.github_token,
+        "gitlab_token": args.gitlab_token,
+        "include_files": include_files,
+        "cache_dir": args.cache_dir,
+    }
+    if args.analyze or args.report:
+        outcomes = iter_ingest_and_analyze(specs, app_config.hackathon_window, **ingest_options)
+    else:
+        outcomes = ((result, None) for result in iter_ingest(specs, **ingest_options))
+    for spec, (result, temporal_report) in zip(specs, outcomes):
         total_commits += len(result.commits)
         total_errors += len(result.errors)
-        temporal_report = analyze_repo(result, app_config.hackathon_window) if args.report or args.analyze else None
 
         print(f"{spec.team} | {spec.repo_url} | commits={len(result.commits)}")
         if temporal_report and args.analyze:
@@ -83,11 +118,7 @@ def main() -> int:
             if genai_warning:
                 print(f"  warning: {genai_warning}")
 
-            submission = _find_submission_for_spec(
-                spec.team,
-                spec.repo_url,
-                submission_map,
-            )
+            submission = _find_submission_for_spec(spec, submission_index)
             reports.append(
                 build_team_report(
                     spec=spec,
@@ -114,30 +145,40 @@ def main() -> int:
     return 0
 
 
-def _load_submission_map(input_path: str) -> list:
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def _load_submission_map(input_path: str) -> list[Submission]:
     try:
         return load_submissions(input_path)
     except (FileNotFoundError, ValueError):
         return []
 
 
-def _normalize_repo_url(url: str) -> str:
-    normalized = (url or "").strip().lower()
-    return normalized.removesuffix(".git")
-
-
-def _find_submission_for_spec(team: str, repo_url: str, submissions: list):
-    normalized_repo = _normalize_repo_url(repo_url)
-    for submission in submissions:
-        for candidate in submission.repo_urls:
-            if _normalize_repo_url(candidate) == normalized_repo:
-                return submission
-
-    lowered_team = team.strip().lower()
+def _index_submissions(submissions: list[Submission]) -> SubmissionIndex:
+    # Earlier submissions win on duplicate keys, matching a first-match scan.
+    by_repo_url: dict[str, Submission] = {}
+    by_title: dict[str, Submission] = {}
     for submission in submissions:
-        if submission.title.strip().lower() == lowered_team:
-            return submission
-    return None
+        for normalized_url in submission.normalized_repo_urls:
+            by_repo_url.setdefault(normalized_url, submission)
+        by_title.setdefault(submission.normalized_title, submission)
+    return by_repo_url, by_title
+
+
+def _find_submission_for_spec(
+    spec: RepoSpec,
+    submission_index: SubmissionIndex,
+) -> Submission | None:
+    by_repo_url, by_title = submission_index
+    submission = by_repo_url.get(spec.normalized_repo_url)
+    if submission is None:
+        submission = by_title.get(spec.team.strip().lower())
+    return submission
 
 
 if __name__ == "__main__":
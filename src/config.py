@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import csv
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 import yaml
 
 from src.models import RepoSpec
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+T = TypeVar("T")
+
+PARSE_CACHE_MAX_ENTRIES = 100
+
+_parse_cache: OrderedDict[tuple[Callable[[Path], Any], str], tuple[int, int, Any]] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class HackathonWindow:
@@ -22,33 +37,89 @@ class AppConfig:
     hackathon_window: HackathonWindow
 
 
+@dataclass(frozen=True)
+class CsvTable:
+    fieldnames: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
+
+    def column_index(self, name: str) -> int | None:
+        """Return the position of column ``name`` (the last one if repeated), or None."""
+        for index in range(len(self.fieldnames) - 1, -1, -1):
+            if self.fieldnames[index] == name:
+                return index
+        return None
+
+
+def cached_file_parse(path: Path, parse: Callable[[Path], T]) -> T:
+    """Return ``parse(path)``, reusing the last result while the file's mtime and size are unchanged.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+    stat = path.stat()
+    key = (parse, os.path.abspath(path))
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            _parse_cache.move_to_end(key)
+            return entry[2]
+
+    parsed = parse(path)
+    with _parse_cache_lock:
+        _parse_cache[key] = (stat.st_mtime_ns, stat.st_size, parsed)
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+def read_csv_table(path: Path) -> CsvTable:
+    """Read a CSV file with a header row, sharing one parse between all loaders of that file."""
+    return cached_file_parse(path, _read_csv_table)
+
+
 def load_repo_specs(input_path: str | Path) -> list[RepoSpec]:
     path = Path(input_path)
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
 
+    return list(cached_file_parse(path, _parse_repo_specs))
+
+
+def load_app_config(config_path: str | Path) -> AppConfig:
+    path = Path(config_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {path}")
+
+    return cached_file_parse(path, _parse_app_config)
+
+
+def _parse_repo_specs(path: Path) -> list[RepoSpec]:
     suffix = path.suffix.lower()
     if suffix == ".csv":
-        with path.open("r", encoding="utf-8", newline="") as fh:
-            reader = csv.DictReader(fh)
-            return _rows_to_specs(reader, str(path))
+        return _pairs_to_specs(_csv_spec_pairs(read_csv_table(path)), str(path))
 
     if suffix in {".yaml", ".yml"}:
         with path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or []
+            data = yaml.load(fh, Loader=_YamlLoader) or []
         rows = _extract_yaml_rows(data)
-        return _rows_to_specs(rows, str(path))
+        return _pairs_to_specs(_mapping_spec_pairs(rows, str(path)), str(path))
 
     raise ValueError(f"Unsupported input format for {path}. Expected .csv or .yaml/.yml")
 
 
-def load_app_config(config_path: str | Path) -> AppConfig:
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+def _read_csv_table(path: Path) -> CsvTable:
+    # Plain csv.reader rows (tuples) rather than DictReader's per-row dicts;
+    # blank lines are skipped as DictReader does.
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        fieldnames = tuple(next(reader, ()))
+        rows = tuple(tuple(row) for row in reader if row)
+    return CsvTable(fieldnames=fieldnames, rows=rows)
 
+
+def _parse_app_config(path: Path) -> AppConfig:
     with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+        data = yaml.load(fh, Loader=_YamlLoader) or {}
 
     window_data = data.get("hackathon_window")
     if not isinstance(window_data, dict):
@@ -83,14 +154,31 @@ def _extract_yaml_rows(data: Any) -> list[dict[str, Any]]:
     )
 
 
-def _rows_to_specs(rows: Any, source: str) -> list[RepoSpec]:
-    specs: list[RepoSpec] = []
+def _csv_spec_pairs(table: CsvTable) -> Iterator[tuple[str | None, str | None]]:
+    team_col = table.column_index("team")
+    repo_url_col = table.column_index("repo_url")
+    for row in table.rows:
+        yield _cell(row, team_col), _cell(row, repo_url_col)
+
+
+def _cell(row: tuple[str, ...], index: int | None) -> str | None:
+    if index is None or index >= len(row):
+        return None
+    return row[index]
+
+
+def _mapping_spec_pairs(rows: Any, source: str) -> Iterator[tuple[Any, Any]]:
     for idx, row in enumerate(rows, start=1):
         if not isinstance(row, dict):
             raise ValueError(f"Invalid row type at {source}:{idx}; expected mapping")
+        yield row.get("team"), row.get("repo_url")
 
-        team = (row.get("team") or "").strip()
-        repo_url = (row.get("repo_url") or "").strip()
+
+def _pairs_to_specs(pairs: Iterable[tuple[Any, Any]], source: str) -> list[RepoSpec]:
+    specs: list[RepoSpec] = []
+    for idx, (raw_team, raw_repo_url) in enumerate(pairs, start=1):
+        team = (raw_team or "").strip()
+        repo_url = (raw_repo_url or "").strip()
         if not team or not repo_url:
             raise ValueError(
                 f"Invalid row at {source}:{idx}; expected non-empty 'team' and 'repo_url'"
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
-import csv
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from html import unescape
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import cached_file_parse, read_csv_table
+from src.models import normalize_repo_url
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional; fall back to regex extraction
+    HTMLParser = None
+
+_URL_RE = re.compile(r"https?://[^\s\"'<>]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LIST_SPLIT_RE = re.compile(r"[;\n|,]+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_SUBMITTED_TO_RE = re.compile(
+    r"<div id=\"submissions\"[^>]*>[\s\S]{0,2000}?<a [^>]*>([^<]+)</a>",
+    re.IGNORECASE,
+)
+_TEAM_SECTION_RE = re.compile(r"<section id=\"app-team\".*?</section>", re.IGNORECASE | re.DOTALL)
+_USER_LINK_RE = re.compile(r"<a class=\"user-profile-link\"[^>]*>([^<]+)</a>", re.IGNORECASE)
+_SOFTWARE_URLS_RE = re.compile(r"<ul data-role=\"software-urls\".*?</ul>", re.IGNORECASE | re.DOTALL)
+_TIME_RE = re.compile(r"<time[^>]+datetime=\"([^\"]+)\"", re.IGNORECASE)
 
 
 @dataclass(frozen=True)
@@ -20,6 +44,16 @@ class Submission:
     repo_urls: list[str]
     submitted_at: str | None
     source: str
+    normalized_title: str = field(init=False, repr=False, compare=False)
+    normalized_repo_urls: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "normalized_title", self.title.strip().lower())
+        object.__setattr__(
+            self,
+            "normalized_repo_urls",
+            tuple(normalize_repo_url(url) for url in self.repo_urls),
+        )
 
 
 def load_submissions(source: Path | str) -> list[Submission]:
@@ -33,34 +67,48 @@ def load_submissions(source: Path | str) -> list[Submission]:
     if path.suffix.lower() != ".csv":
         raise ValueError(f"Unsupported submission source for {path}; expected .csv or URL")
 
-    with path.open("r", encoding="utf-8", newline="") as fh:
-        reader = csv.DictReader(fh)
-        rows = list(reader)
+    return list(cached_file_parse(path, _parse_submissions_csv))
 
-    return [_row_to_submission(row, str(path), idx) for idx, row in enumerate(rows, start=1)]
 
+def _parse_submissions_csv(path: Path) -> list[Submission]:
+    table = read_csv_table(path)
+    # Later duplicate columns win, as they would in a per-row dict.
+    header_index = {_normalize_key(name): pos for pos, name in enumerate(table.fieldnames)}
+    return [_row_to_submission(row, header_index, str(path)) for row in table.rows]
 
-def _row_to_submission(row: dict[str, str], source: str, idx: int) -> Submission:
-    if not isinstance(row, dict):
-        raise ValueError(f"Invalid CSV row at {source}:{idx}; expected mapping")
 
+def _row_to_submission(
+    values: tuple[str, ...],
+    header_index: dict[str, int],
+    source: str,
+) -> Submission:
+    """Build a Submission from CSV cells, located via a normalized-header -> position index."""
     title = _first_non_empty(
-        row,
+        values,
+        header_index,
         "project title",
         "title",
         "project",
         "submission title",
     )
-    description = _first_non_empty(row, "about the project", "description", "summary")
+    description = _first_non_empty(
+        values,
+        header_index,
+        "about the project",
+        "description",
+        "summary",
+    )
     track = _first_non_empty(
-        row,
+        values,
+        header_index,
         "selected track",
         "track",
         "opt-in prizes",
         "prize category",
     )
     submitted_at = _first_non_empty(
-        row,
+        values,
+        header_index,
         "submitted at",
         "submission timestamp",
         "project created at",
@@ -69,14 +117,16 @@ def _row_to_submission(row: dict[str, str], source: str, idx: int) -> Submission
 
     member_blob = _join_non_empty(
         _first_non_empty(
-            row,
+            values,
+            header_index,
             "team members",
             "project members",
             "member names",
             "participants",
         ),
         _first_non_empty(
-            row,
+            values,
+            header_index,
             "team member emails",
             "participant emails",
             "participants email",
@@ -86,7 +136,8 @@ def _row_to_submission(row: dict[str, str], source: str, idx: int) -> Submission
 
     repo_blob = _join_non_empty(
         _first_non_empty(
-            row,
+            values,
+            header_index,
             "try it out links",
             "try it out",
             "repository",
@@ -95,8 +146,8 @@ def _row_to_submission(row: dict[str, str], source: str, idx: int) -> Submission
             "github",
             "gitlab",
         ),
-        _first_key_containing(row, "github", "git hub", "gitlab"),
-        _first_non_empty(row, "project url", "submission url"),
+        _first_key_containing(values, header_index, "github", "git hub", "gitlab"),
+        _first_non_empty(values, header_index, "project url", "submission url"),
     )
     repo_urls = _extract_repo_urls(repo_blob)
 
@@ -111,45 +162,46 @@ def _row_to_submission(row: dict[str, str], source: str, idx: int) -> Submission
     )
 
 
-def _first_non_empty(row: dict[str, str], *candidates: str) -> str:
-    normalized = {_normalize_key(k): (v or "").strip() for k, v in row.items()}
+def _first_non_empty(values: tuple[str, ...], header_index: dict[str, int], *candidates: str) -> str:
     for key in candidates:
-        value = normalized.get(_normalize_key(key), "")
+        value = _cell_value(values, header_index.get(_normalize_key(key)))
         if value:
             return value
     return ""
 
 
-def _first_key_containing(row: dict[str, str], *substrings: str) -> str:
+def _first_key_containing(
+    values: tuple[str, ...],
+    header_index: dict[str, int],
+    *substrings: str,
+) -> str:
     """Return the first non-empty value whose column name contains any of the substrings."""
-    normalized = {_normalize_key(k): (v or "").strip() for k, v in row.items()}
     for substr in substrings:
         norm_substr = _normalize_key(substr)
-        for key, value in normalized.items():
-            if norm_substr in key and value:
-                return value
+        for key, pos in header_index.items():
+            if norm_substr in key:
+                value = _cell_value(values, pos)
+                if value:
+                    return value
     return ""
 
 
+def _cell_value(values: tuple[str, ...], pos: int | None) -> str:
+    if pos is None or pos >= len(values):
+        return ""
+    return values[pos].strip()
+
+
+@lru_cache(maxsize=512)
 def _normalize_key(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
+    return _NON_ALNUM_RE.sub(" ", value.lower()).strip()
 
 
 def _split_list_field(value: str) -> list[str]:
     if not value:
         return []
-    items = [p.strip() for p in re.split(r"[;\n|,]+", value)]
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for item in items:
-        if not item:
-            continue
-        lowered = item.lower()
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        deduped.append(item)
-    return deduped
+    items = (p.strip() for p in _LIST_SPLIT_RE.split(value))
+    return _dedupe(item for item in items if item)
 
 
 def _join_non_empty(*values: str) -> str:
@@ -157,24 +209,23 @@ def _join_non_empty(*values: str) -> str:
 
 
 def _extract_repo_urls(value: str) -> list[str]:
-    urls = _extract_urls(value)
-    repos: list[str] = []
-    seen: set[str] = set()
-
-    for url in urls:
-        parsed = urlparse(url)
-        host = parsed.netloc.lower()
-        if not host:
-            continue
-        if "github.com" not in host and "gitlab" not in host:
-            continue
-        normalized = _normalize_repo_url(parsed)
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        repos.append(normalized)
-
-    return repos
+    # dict keys double as an insertion-ordered set.
+    repos: dict[str, None] = {}
+    for url in _extract_urls(value):
+        repo_url = _repo_root_url(url)
+        if repo_url is not None:
+            repos[repo_url] = None
+    return list(repos)
+
+
+@lru_cache(maxsize=4096)
+def _repo_root_url(url: str) -> str | None:
+    """Return the normalized repo root for GitHub/GitLab URLs, or None for other hosts."""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if "github.com" not in host and "gitlab" not in host:
+        return None
+    return _normalize_repo_url(parsed)
 
 
 def _normalize_repo_url(parsed) -> str:
@@ -192,7 +243,7 @@ def _normalize_repo_url(parsed) -> str:
 def _extract_urls(value: str) -> list[str]:
     if not value:
         return []
-    return [m.group(0).rstrip(").,;") for m in re.finditer(r"https?://[^\s\"'<>]+", value)]
+    return [m.group(0).rstrip(").,;") for m in _URL_RE.finditer(value)]
 
 
 def _looks_like_url(value: str) -> bool:
@@ -200,11 +251,74 @@ def _looks_like_url(value: str) -> bool:
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    # One keep-alive pool for every Devpost fetch in the process, retrying
+    # transient gateway errors; the final response still goes through
+    # raise_for_status so callers see the same HTTPError as before.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.25,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _load_submission_from_url(url: str) -> Submission:
-    response = requests.get(url, timeout=30)
+    response = _http_session().get(url, timeout=30)
     response.raise_for_status()
     html = response.text
+    if HTMLParser is not None:
+        return _submission_from_html_selectolax(html, url)
+    return _submission_from_html_regex(html, url)
 
+
+def _submission_from_html_selectolax(html: str, url: str) -> Submission:
+    tree = HTMLParser(html)
+
+    title = _node_attribute(tree.css_first('meta[property="og:title"]'), "content")
+    if not title:
+        title_node = tree.css_first("title")
+        title = _squash_whitespace(title_node.text()) if title_node else ""
+    description = _node_attribute(tree.css_first('meta[name="description"]'), "content")
+
+    track_node = tree.css_first("div#submissions a")
+    track = _squash_whitespace(track_node.text()) if track_node else ""
+
+    names = [
+        _squash_whitespace(node.text()) for node in tree.css("section#app-team a.user-profile-link")
+    ]
+    team_members = _dedupe([name for name in names if name])
+
+    hrefs = [_node_attribute(node, "href") for node in tree.css('ul[data-role="software-urls"] a')]
+    repo_urls = _extract_repo_urls(" ".join(hrefs))
+
+    submitted_at = _node_attribute(tree.css_first("time[datetime]"), "datetime")
+
+    return Submission(
+        title=title or "(untitled submission)",
+        description=description,
+        track=track,
+        team_members=team_members,
+        repo_urls=repo_urls,
+        submitted_at=submitted_at or None,
+        source=url,
+    )
+
+
+def _node_attribute(node, name: str) -> str:
+    if node is None:
+        return ""
+    return (node.attributes.get(name) or "").strip()
+
+
+def _submission_from_html_regex(html: str, url: str) -> Submission:
     title = _extract_meta_content(html, "property", "og:title") or _extract_title_tag(html)
     description = _extract_meta_content(html, "name", "description") or ""
     track = _extract_submitted_to_text(html)
@@ -224,75 +338,72 @@ def _load_submission_from_url(url: str) -> Submission:
 
 
 def _extract_meta_content(html: str, attr_name: str, attr_value: str) -> str:
-    pattern = (
-        rf"<meta[^>]+{attr_name}\s*=\s*[\"']{re.escape(attr_value)}[\"'][^>]*content\s*=\s*[\"']([^\"']*)[\"']"
-    )
-    match = re.search(pattern, html, flags=re.IGNORECASE)
+    match = _meta_content_re(attr_name, attr_value).search(html)
     return unescape(match.group(1)).strip() if match else ""
 
 
+@lru_cache(maxsize=64)
+def _meta_content_re(attr_name: str, attr_value: str) -> re.Pattern[str]:
+    return re.compile(
+        rf"<meta[^>]+{attr_name}\s*=\s*[\"']{re.escape(attr_value)}[\"'][^>]*content\s*=\s*[\"']([^\"']*)[\"']",
+        re.IGNORECASE,
+    )
+
+
 def _extract_title_tag(html: str) -> str:
-    match = re.search(r"<title>(.*?)</title>", html, flags=re.IGNORECASE | re.DOTALL)
+    match = _TITLE_RE.search(html)
     if not match:
         return ""
     return _clean_text(match.group(1))
 
 
 def _extract_submitted_to_text(html: str) -> str:
-    anchor = re.search(
-        r"<div id=\"submissions\"[^>]*>[\s\S]{0,2000}?<a [^>]*>([^<]+)</a>",
-        html,
-        flags=re.IGNORECASE,
-    )
+    anchor = _SUBMITTED_TO_RE.search(html)
     if not anchor:
         return ""
     return _clean_text(anchor.group(1))
 
 
 def _extract_team_members(html: str) -> list[str]:
-    section = _extract_section(html, r"<section id=\"app-team\".*?</section>")
+    section = _extract_section(html, _TEAM_SECTION_RE)
     if not section:
         return []
 
-    names = re.findall(
-        r"<a class=\"user-profile-link\"[^>]*>([^<]+)</a>",
-        section,
-        flags=re.IGNORECASE,
-    )
+    names = _USER_LINK_RE.findall(section)
     return _dedupe([_clean_text(name) for name in names if _clean_text(name)])
 
 
 def _extract_repo_urls_from_html(html: str) -> list[str]:
-    nav = _extract_section(html, r"<ul data-role=\"software-urls\".*?</ul>")
+    nav = _extract_section(html, _SOFTWARE_URLS_RE)
     if not nav:
         return []
     return _extract_repo_urls(" ".join(_extract_urls(nav)))
 
 
 def _extract_datetime_value(html: str) -> str | None:
-    match = re.search(r"<time[^>]+datetime=\"([^\"]+)\"", html, flags=re.IGNORECASE)
+    match = _TIME_RE.search(html)
     if not match:
         return None
     value = _clean_text(match.group(1))
     return value or None
 
 
-def _extract_section(html: str, pattern: str) -> str:
-    match = re.search(pattern, html, flags=re.IGNORECASE | re.DOTALL)
+def _extract_section(html: str, pattern: re.Pattern[str]) -> str:
+    match = pattern.search(html)
     return match.group(0) if match else ""
 
 
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", unescape(value)).strip()
+    return _squash_whitespace(unescape(value))
+
+
+def _squash_whitespace(value: str) -> str:
+    return _WHITESPACE_RE.sub(" ", value).strip()
 
 
 def _dedupe(items: Iterable[str]) -> list[str]:
-    result: list[str] = []
-    seen: set[str] = set()
+    """Case-insensitively dedupe, keeping the first spelling of each item in order."""
+    first_seen: dict[str, str] = {}
     for item in items:
-        key = item.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(item)
-    return result
+        first_seen.setdefault(item.lower(), item)
+    return list(first_seen.values())
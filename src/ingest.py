@@ -1,19 +1,82 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import re
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 from urllib.parse import urlparse
 
+from src.config import HackathonWindow
 from src.models import Commit, IngestResult, RepoSpec
+from src.temporal import TemporalAccumulator, TemporalReport, analyze_repo
+
+try:
+    import pygit2
+except ImportError:  # optional; fall back to parsing `git log` output
+    pygit2 = None
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+CommitCallback = Callable[[Commit], None]
 
 GITHUB_HOSTS = {"github.com", "www.github.com"}
 
+# Plain http(s) URLs split the same way urlparse would; anything with
+# whitespace, ";params" or IPv6 brackets falls back to urlparse.
+_HTTP_URL_RE = re.compile(r"(?i:https?)://([^/?#\[\]\s]*)((?:/[^?#;\s]*)?)(?:[?#]\S*)?")
+
+# Strict ISO-8601 with a zero UTC offset, as emitted by git's %aI.
+_UTC_ISO_RE = re.compile(r"([0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2})(?:Z|[+-]00:00)")
+
+_AUTH_FAILURE_RE = re.compile(
+    r"authentication failed|could not read username|access denied|unauthorized",
+    re.IGNORECASE,
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# SHA-1 or SHA-256 object ids, as printed by %H.
+_SHA_RE = re.compile(rb"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+_LOG_CHUNK_SIZE = 1 << 20
+
+# History analysis only needs commits and trees, so clones skip file contents.
+_PARTIAL_CLONE_ARGS = ["--filter=blob:none", "--single-branch"]
+
+# Git's own wording when a remote refuses the --filter a clone asked for.
+_FILTER_REFUSED_RE = re.compile(
+    rb"filter '[^']*' not supported|filtering capability not negotiated|invalid filter-spec"
+)
+
+INGEST_CACHE_MAX_ENTRIES = 256
+
+# Per-clone-path locks for --cache-dir, with a user count; see _shared_lock.
+_cache_locks: dict[str, tuple[threading.Lock, int]] = {}
+_cache_locks_guard = threading.Lock()
 
-@dataclass(frozen=True)
+# Successful ingests keyed by (repo URL, token digest, include_files), so a
+# repo listed by several submissions is cloned and parsed once per process.
+IngestCacheKey = tuple[str, str, bool]
+_ingest_cache: OrderedDict[IngestCacheKey, tuple[Commit, ...]] = OrderedDict()
+_ingest_cache_lock = threading.Lock()
+# Per-key locks with a count of the ingests using them; see _shared_lock.
+_ingest_key_locks: dict[IngestCacheKey, tuple[threading.Lock, int]] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedRepoURL:
     provider: str
     host: str
@@ -22,13 +85,14 @@ class ParsedRepoURL:
     namespace: str | None = None
 
 
+@lru_cache(maxsize=4096)
 def parse_repo_url(repo_url: str) -> ParsedRepoURL:
-    parsed = urlparse(repo_url)
-    host = parsed.netloc.lower().strip()
+    netloc, path = _split_netloc_and_path(repo_url)
+    host = netloc.lower().strip()
     if not host:
         return ParsedRepoURL(provider="unknown", host="")
 
-    parts = [p for p in parsed.path.strip("/").split("/") if p]
+    parts = [p for p in path.strip("/").split("/") if p]
     if host in GITHUB_HOSTS:
         if len(parts) < 2:
             raise ValueError(f"Invalid GitHub URL: {repo_url}")
@@ -51,10 +115,22 @@ def parse_repo_url(repo_url: str) -> ParsedRepoURL:
     return ParsedRepoURL(provider="unknown", host=host)
 
 
+def _split_netloc_and_path(repo_url: str) -> tuple[str, str]:
+    match = _HTTP_URL_RE.fullmatch(repo_url)
+    if match and match.group(1).isascii():
+        return match.group(1), match.group(2)
+    parsed = urlparse(repo_url)
+    return parsed.netloc, parsed.path
+
+
 def ingest_repo(
     spec: RepoSpec,
     github_token: str | None = None,
     gitlab_token: str | None = None,
+    include_files: bool = True,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+    on_commit: CommitCallback | None = None,
 ) -> IngestResult:
     result = IngestResult(spec=spec)
 
@@ -83,102 +159,504 @@ def ingest_repo(
             path = f"{namespace}/{repo}".strip("/")
             clone_url = f"https://oauth2:{gitlab_token}@{parsed.host}/{path}.git"
 
-    temp_dir = tempfile.mkdtemp(prefix="submission-originality-")
-    repo_dir = os.path.join(temp_dir, "repo.git")
+    # Only a digest of the token goes into the key so raw tokens are not retained.
+    token_digest = hashlib.sha256((active_token or "").encode("utf-8")).hexdigest()[:8]
+    cache_key = (spec.repo_url, token_digest, include_files)
+    # Holding the key lock makes concurrent duplicates wait for the first
+    # ingest and reuse it instead of cloning in parallel.
+    with _shared_lock(_ingest_key_locks, _ingest_cache_lock, cache_key):
+        with _ingest_cache_lock:
+            cached = _ingest_cache.get(cache_key)
+            if cached is not None:
+                _ingest_cache.move_to_end(cache_key)
+        if cached is not None:
+            result.commits = list(_tap(cached, on_commit))
+            return result
+
+        with _repo_workspace(spec.repo_url, cache_dir, workdir) as repo_dir:
+            reuse = cache_dir is not None
+            persistent = reuse or workdir is not None
+            if _clone_or_fetch(
+                result, parsed, clone_url, active_token, repo_dir, reuse, persistent
+            ):
+                if reuse:
+                    _write_commit_graph(repo_dir)
+                _read_commit_log(result, repo_dir, active_token, include_files, on_commit)
+
+        if result.ok and not result.warnings:
+            with _ingest_cache_lock:
+                _ingest_cache[cache_key] = tuple(result.commits)
+                _ingest_cache.move_to_end(cache_key)
+                while len(_ingest_cache) > INGEST_CACHE_MAX_ENTRIES:
+                    _ingest_cache.popitem(last=False)
+    return result
+
+
+def clear_ingest_cache() -> None:
+    with _ingest_cache_lock:
+        _ingest_cache.clear()
+
+
+@contextmanager
+def _shared_lock(
+    locks: dict[K, tuple[threading.Lock, int]],
+    guard: threading.Lock,
+    key: K,
+) -> Iterator[None]:
+    # Holds the lock shared by everyone using `key`. Each entry counts its
+    # users and is dropped when the last one leaves, so a table only ever
+    # holds the keys in flight.
+    with guard:
+        lock, users = locks.get(key, (None, 0))
+        lock = lock or threading.Lock()
+        locks[key] = (lock, users + 1)
     try:
-        clone_proc = subprocess.run(
-            ["git", "clone", "--bare", clone_url, repo_dir],
+        with lock:
+            yield
+    finally:
+        with guard:
+            lock, users = locks[key]
+            if users == 1:
+                del locks[key]
+            else:
+                locks[key] = (lock, users - 1)
+
+
+def ingest_many(
+    specs: Sequence[RepoSpec],
+    *,
+    max_workers: int | None = None,
+    github_token: str | None = None,
+    gitlab_token: str | None = None,
+    include_files: bool = True,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> list[IngestResult]:
+    return list(
+        iter_ingest(
+            specs,
+            max_workers=max_workers,
+            github_token=github_token,
+            gitlab_token=gitlab_token,
+            include_files=include_files,
+            cache_dir=cache_dir,
+            workdir=workdir,
+        )
+    )
+
+
+def iter_ingest(
+    specs: Sequence[RepoSpec],
+    *,
+    max_workers: int | None = None,
+    github_token: str | None = None,
+    gitlab_token: str | None = None,
+    include_files: bool = True,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> Iterator[IngestResult]:
+    ingest = partial(
+        ingest_repo,
+        github_token=github_token,
+        gitlab_token=gitlab_token,
+        include_files=include_files,
+        cache_dir=cache_dir,
+        workdir=workdir,
+    )
+    return _iter_concurrently(ingest, specs, max_workers)
+
+
+def ingest_and_analyze(
+    spec: RepoSpec,
+    window: HackathonWindow,
+    github_token: str | None = None,
+    gitlab_token: str | None = None,
+    include_files: bool = True,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> tuple[IngestResult, TemporalReport]:
+    # Commits are classified as they are parsed, so the temporal analysis
+    # needs no second walk (or timestamp parse) over the commit list.
+    accumulator = TemporalAccumulator(window)
+    result = ingest_repo(
+        spec,
+        github_token=github_token,
+        gitlab_token=gitlab_token,
+        include_files=include_files,
+        cache_dir=cache_dir,
+        workdir=workdir,
+        on_commit=accumulator.add,
+    )
+    if accumulator.total_commits != len(result.commits):
+        # A read that failed part-way (or was retried) fed commits that were
+        # then discarded; analyze what was actually kept.
+        return result, analyze_repo(result, window)
+    return result, accumulator.finish(result)
+
+
+def iter_ingest_and_analyze(
+    specs: Sequence[RepoSpec],
+    window: HackathonWindow,
+    *,
+    max_workers: int | None = None,
+    github_token: str | None = None,
+    gitlab_token: str | None = None,
+    include_files: bool = True,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> Iterator[tuple[IngestResult, TemporalReport]]:
+    ingest = partial(
+        ingest_and_analyze,
+        window=window,
+        github_token=github_token,
+        gitlab_token=gitlab_token,
+        include_files=include_files,
+        cache_dir=cache_dir,
+        workdir=workdir,
+    )
+    return _iter_concurrently(ingest, specs, max_workers)
+
+
+def _iter_concurrently(
+    ingest: Callable[[RepoSpec], T],
+    specs: Sequence[RepoSpec],
+    max_workers: int | None,
+) -> Iterator[T]:
+    # Clones and log reads are git subprocess I/O, so threads overlap them
+    # well. Results are yielded in input order as soon as each is ready.
+    workers = max_workers or max(1, min(32, 2 * len(specs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(ingest, specs)
+
+
+@contextmanager
+def _repo_workspace(
+    repo_url: str,
+    cache_dir: str | Path | None,
+    workdir: str | Path | None = None,
+) -> Iterator[str]:
+    # Without a cache dir each clone is throwaway: either a private temp dir
+    # removed afterwards, or a unique entry in a caller-owned workdir that the
+    # caller removes in one go. With a cache dir, the bare clone is kept under
+    # a stable per-URL name so later runs only fetch new objects; a per-path
+    # lock keeps duplicate specs from racing on the same clone.
+    if cache_dir is None and workdir is not None:
+        yield os.path.join(workdir, f"repo-{uuid.uuid4().hex}.git")
+        return
+
+    if cache_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="submission-originality-")
+        try:
+            yield os.path.join(temp_dir, "repo.git")
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return
+
+    os.makedirs(cache_dir, exist_ok=True)
+    digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+    repo_dir = os.path.join(cache_dir, f"{digest}.git")
+    with _shared_lock(_cache_locks, _cache_locks_guard, repo_dir):
+        yield repo_dir
+
+
+def _clone_or_fetch(
+    result: IngestResult,
+    parsed: ParsedRepoURL,
+    clone_url: str,
+    active_token: str | None,
+    repo_dir: str,
+    reuse: bool,
+    persistent: bool,
+) -> bool:
+    spec = result.spec
+    if reuse and os.path.isdir(repo_dir):
+        # Like the --single-branch clone, refresh only the remote's default
+        # branch, into the local branch HEAD points at.
+        head_proc = subprocess.run(
+            ["git", "-C", repo_dir, "symbolic-ref", "-q", "HEAD"],
             check=False,
             capture_output=True,
-            text=True,
         )
-        if clone_proc.returncode != 0:
-            message = _sanitize_error_message(clone_proc.stderr or clone_proc.stdout, active_token)
-            if parsed.provider == "unknown":
-                result.warnings.append(
-                    f"Unable to clone unknown host repo {spec.repo_url}; skipped ({message})"
-                )
-                return result
-
-            if not active_token and _looks_like_auth_failure(message):
-                result.warnings.append(
-                    f"Repo may be private: {spec.repo_url}; missing token, skipped"
-                )
-                return result
-
-            result.errors.append(f"Failed to clone repo {spec.repo_url}: {message}")
-            return result
+        head_ref = _decode(head_proc.stdout or b"").strip()
+        if head_proc.returncode == 0 and head_ref:
+            fetch_cmd = ["git", "-C", repo_dir]
+            if clone_url != spec.repo_url:
+                # Fetch through the named remote, which carries the partial
+                # clone filter, and hand it the credentialed URL for this
+                # process only: fetching from a URL would record that URL,
+                # token included, as a promisor remote in the clone's config.
+                fetch_cmd.extend(["-c", f"url.{clone_url}.insteadOf={spec.repo_url}"])
+            fetch_cmd.extend(["fetch", "--force", "origin", f"+HEAD:{head_ref}"])
+            fetch_proc = subprocess.run(fetch_cmd, check=False, capture_output=True)
+            if fetch_proc.returncode == 0:
+                return True
+        # Stale or corrupt cache entry; fall back to a fresh clone.
+        shutil.rmtree(repo_dir, ignore_errors=True)
+
+    clone_proc = _clone(clone_url, repo_dir, _PARTIAL_CLONE_ARGS)
+    if clone_proc.returncode != 0 and _FILTER_REFUSED_RE.search(clone_proc.stderr or b""):
+        # Remote refused the partial clone outright; take the full history.
+        shutil.rmtree(repo_dir, ignore_errors=True)
+        clone_proc = _clone(clone_url, repo_dir, [])
+    if clone_proc.returncode != 0:
+        if reuse:
+            shutil.rmtree(repo_dir, ignore_errors=True)
+        message = _sanitize_error_message(clone_proc.stderr or clone_proc.stdout, active_token)
+        if parsed.provider == "unknown":
+            result.warnings.append(
+                f"Unable to clone unknown host repo {spec.repo_url}; skipped ({message})"
+            )
+            return False
+
+        if not active_token and _looks_like_auth_failure(message):
+            result.warnings.append(
+                f"Repo may be private: {spec.repo_url}; missing token, skipped"
+            )
+            return False
+
+        result.errors.append(f"Failed to clone repo {spec.repo_url}: {message}")
+        return False
 
-        log_proc = subprocess.run(
-            [
-                "git",
-                "-C",
-                repo_dir,
-                "log",
-                "--pretty=format:%H%x00%an%x00%ae%x00%aI%x00%s",
-                "--name-only",
-                "--no-merges",
-            ],
+    if persistent and clone_url != spec.repo_url:
+        # Keep tokens out of the config of clones that outlive this call.
+        subprocess.run(
+            ["git", "-C", repo_dir, "remote", "set-url", "origin", spec.repo_url],
             check=False,
             capture_output=True,
-            text=True,
         )
+    return True
+
+
+def _clone(clone_url: str, repo_dir: str, extra_args: list[str]) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(
+        ["git", "clone", "--bare", *extra_args, clone_url, repo_dir],
+        check=False,
+        capture_output=True,
+    )
+
+
+def _write_commit_graph(repo_dir: str) -> None:
+    # Best effort, and only for cached clones: the graph lets later runs walk
+    # history without parsing commit objects, but a throwaway clone is read
+    # once, so writing one would cost more than the walk it speeds up.
+    subprocess.run(
+        ["git", "-C", repo_dir, "commit-graph", "write", "--reachable", "--no-progress"],
+        check=False,
+        capture_output=True,
+    )
+
+
+def _read_commit_log(
+    result: IngestResult,
+    repo_dir: str,
+    active_token: str | None,
+    include_files: bool,
+    on_commit: CommitCallback | None = None,
+) -> None:
+    if pygit2 is not None:
+        try:
+            result.commits = list(_tap(_walk_commits_pygit2(repo_dir, include_files), on_commit))
+            return
+        except (pygit2.GitError, LookupError, ValueError):
+            pass  # let `git log` retry and report the failure in its own words
+
+    log_cmd = [
+        "git",
+        "-C",
+        repo_dir,
+        "log",
+        "-z",
+        "--pretty=format:%H%x00%an%x00%ae%x00%aI%x00%s",
+        "--no-merges",
+    ]
+    if include_files:
+        # Exact renames only: scoring inexact ones would lazily fetch the
+        # blobs the partial clone skipped.
+        log_cmd.extend(["--name-only", "-M100%"])
+    # Parse commits as git writes them instead of buffering the whole log;
+    # stderr goes to a temp file so a chatty stderr can't stall the pipe.
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            log_cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            bufsize=_LOG_CHUNK_SIZE,
+        ) as log_proc:
+            chunks = iter(partial(log_proc.stdout.read, _LOG_CHUNK_SIZE), b"")
+            skipped: list[None] = []
+            commits = list(
+                _tap(_parse_git_log_output(chunks, partial(skipped.append, None)), on_commit)
+            )
         if log_proc.returncode != 0:
-            message = _sanitize_error_message(log_proc.stderr or log_proc.stdout, active_token)
-            result.errors.append(f"Failed to read commit history for {spec.repo_url}: {message}")
-            return result
+            stderr_file.seek(0)
+            message = _sanitize_error_message(stderr_file.read(), active_token)
+            result.errors.append(
+                f"Failed to read commit history for {result.spec.repo_url}: {message}"
+            )
+            return
 
-        result.commits = _parse_git_log_output(log_proc.stdout)
-        return result
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    result.commits = commits
+    if skipped:
+        result.warnings.append(
+            f"Skipped {len(skipped)} unreadable commit record(s) in {result.spec.repo_url}; "
+            "commit counts for this repo may be incomplete"
+        )
 
 
-def _parse_git_log_output(output: str) -> list[Commit]:
-    commits: list[Commit] = []
-    for block in output.split("\n\n"):
-        block = block.strip("\n")
-        if not block:
-            continue
-        lines = block.splitlines()
-        header = lines[0]
-        parts = header.split("\x00")
-        if len(parts) != 5:
+def _tap(commits: Iterable[Commit], on_commit: CommitCallback | None) -> Iterator[Commit]:
+    for commit in commits:
+        if on_commit is not None:
+            on_commit(commit)
+        yield commit
+
+
+def _walk_commits_pygit2(repo_dir: str, include_files: bool) -> Iterator[Commit]:
+    # Mirrors `git log --no-merges --name-only -M100%`: newest first, parents
+    # after children, root commits diffed against the empty tree, exact
+    # renames collapsed to the new path.
+    repo = pygit2.Repository(repo_dir)
+    for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME):
+        if len(commit.parent_ids) > 1:
             continue
-        sha, author, email, timestamp, message = parts
-        files_changed = [line.strip() for line in lines[1:] if line.strip()]
-        commits.append(
-            Commit(
-                sha=sha,
-                author=author,
-                email=email,
-                timestamp=_normalize_timestamp(timestamp),
-                message=message,
-                files_changed=files_changed,
-            )
+        encoding = commit.message_encoding or "utf-8"
+        author = commit.author
+        timestamp = datetime.fromtimestamp(author.time, timezone.utc)
+        yield Commit(
+            sha=str(commit.id),
+            author=sys.intern(author.raw_name.decode(encoding, errors="replace")),
+            email=sys.intern(author.raw_email.decode(encoding, errors="replace")),
+            timestamp=timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            message=_commit_subject(commit.raw_message.decode(encoding, errors="replace")),
+            files_changed=_changed_paths_pygit2(commit) if include_files else (),
         )
-    return commits
+
+
+def _changed_paths_pygit2(commit: pygit2.Commit) -> tuple[str, ...]:
+    if commit.parent_ids:
+        diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+    else:
+        diff = commit.tree.diff_to_tree(swap=True)
+    diff.find_similar(pygit2.GIT_DIFF_FIND_RENAMES | pygit2.GIT_DIFF_FIND_EXACT_MATCH_ONLY)
+    return tuple(sys.intern(delta.new_file.path) for delta in diff.deltas)
+
+
+def _commit_subject(message: str) -> str:
+    # Same as git's %s: the first paragraph, lines joined with single spaces.
+    # Git only trims ASCII whitespace, so control characters and NBSP stay.
+    lines: list[str] = []
+    for line in message.split("\n"):
+        line = line.rstrip(" \t\r\n")
+        if line:
+            lines.append(line)
+        elif lines:
+            break
+    return " ".join(lines)
+
+
+def _parse_git_log_output(
+    chunks: Iterable[bytes],
+    on_skip: Callable[[], None] | None = None,
+) -> Iterator[Commit]:
+    # With -z every field is NUL-terminated and none can contain a NUL, so
+    # records are read by position rather than split on a marker that a
+    # commit subject could forge. A record is five header fields; %s never
+    # holds a newline, so one in the subject field means the first path
+    # follows it, and the remaining paths run up to an empty field. Malformed
+    # records are dropped and reported through on_skip.
+    skip = on_skip or (lambda: None)
+    header: list[bytes] = []
+    paths: list[bytes] | None = None
+    resyncing = False
+    for field in _iter_log_fields(chunks):
+        if paths is not None:
+            if field:
+                paths.append(field)
+                continue
+        elif not header and not _SHA_RE.fullmatch(field):
+            # Not the start of a record; resynchronize on the next sha.
+            if field and not resyncing:
+                resyncing = True
+                skip()
+            continue
+        else:
+            resyncing = False
+            header.append(field)
+            if len(header) < 5:
+                continue
+            subject, newline, first_path = header[4].partition(b"\n")
+            if newline:
+                header[4] = subject
+                paths = [first_path]
+                continue
+        commit = _parse_log_record(header, paths or [])
+        if commit is not None:
+            yield commit
+        else:
+            skip()
+        header = []
+        paths = None
+    if header:
+        commit = _parse_log_record(header, paths or []) if len(header) == 5 else None
+        if commit is not None:
+            yield commit
+        else:
+            skip()
+
+
+def _iter_log_fields(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        fields = (pending + chunk).split(b"\x00")
+        pending = fields.pop()
+        yield from fields
+    yield pending
+
+
+def _parse_log_record(header: list[bytes], paths: list[bytes]) -> Commit | None:
+    # Decode only the individual fields, and drop anything that is not a
+    # well-formed commit rather than let it reach the temporal analysis.
+    sha, author, email, timestamp, subject = header
+    normalized = _normalize_timestamp(timestamp.decode("ascii", errors="replace"))
+    if not _SHA_RE.fullmatch(sha) or normalized is None:
+        return None
+    # Paths and identities repeat across most commits; interning keeps one copy each.
+    return Commit(
+        sha=sha.decode("ascii"),
+        author=sys.intern(_decode(author)),
+        email=sys.intern(_decode(email)),
+        timestamp=normalized,
+        message=_decode(subject),
+        files_changed=tuple(sys.intern(_decode(path)) for path in paths if path),
+    )
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace")
 
 
 def _looks_like_auth_failure(message: str) -> bool:
-    text = message.lower()
-    markers = ["authentication failed", "could not read username", "access denied", "unauthorized"]
-    return any(marker in text for marker in markers)
+    return _AUTH_FAILURE_RE.search(message) is not None
 
 
-def _sanitize_error_message(message: str, token: str | None) -> str:
-    cleaned = " ".join(message.strip().split()) if message else "unknown error"
-    if token:
-        cleaned = cleaned.replace(token, "***")
-    return cleaned
+def _sanitize_error_message(message: str | bytes | None, token: str | None) -> str:
+    if not message:
+        return "unknown error"
+    if isinstance(message, bytes):
+        message = _decode(message)
+    if not token:
+        return _WHITESPACE_RE.sub(" ", message).strip()
+    # Collapse whitespace and redact the token in a single scan.
+    pattern = re.compile(rf"\s+|{re.escape(token)}")
+    return pattern.sub(lambda m: "***" if m.group(0) == token else " ", message).strip()
 
 
-def _normalize_timestamp(raw_value: str) -> str:
-    if not raw_value:
-        return ""
+def _normalize_timestamp(raw_value: str) -> str | None:
+    match = _UTC_ISO_RE.fullmatch(raw_value)
+    if match:
+        return f"{match.group(1)}Z"
 
     try:
-        dt = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
-        return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        dt = datetime.fromisoformat(raw_value)
     except ValueError:
-        return raw_value
+        return None
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -3,20 +3,29 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+def normalize_repo_url(url: str) -> str:
+    """Return a comparison key for repo URLs: stripped, lowercased, without a trailing .git."""
+    return (url or "").strip().lower().removesuffix(".git")
+
+
+@dataclass(frozen=True, slots=True)
 class RepoSpec:
     team: str
     repo_url: str
+    normalized_repo_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "normalized_repo_url", normalize_repo_url(self.repo_url))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     sha: str
     author: str
     email: str
     timestamp: str
     message: str
-    files_changed: list[str]
+    files_changed: tuple[str, ...]
 
 
 @dataclass
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import import_module
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
 
 from src.devpost import Submission
 from src.models import IngestResult, RepoSpec
@@ -14,6 +17,11 @@ if TYPE_CHECKING:
 
 Severity = Literal["clean", "review-recommended", "flagged"]
 
+_WRITE_WORKERS = 8
+_SEVERITY_RANK = {"flagged": 0, "review-recommended": 1, "clean": 2}
+# Runs of anything str.isalnum() rejects (\w is alnum plus "_").
+_SLUG_SEPARATOR_RE = re.compile(r"[\W_]+")
+
 
 @dataclass(frozen=True)
 class TeamReport:
@@ -109,93 +117,89 @@ def render_team_report(report: TeamReport) -> str:
     devpost_track = report.devpost_track or "Not provided"
     members = ", ".join(report.devpost_team_members) if report.devpost_team_members else "Not provided"
 
-    lines = [
-        f"# {report.team} - {report.overall_flag.upper()}",
-        "",
-        f"**Repo:** {report.repo_url}",
-        f"**Devpost:** {devpost_title} | Track: {devpost_track}",
-        f"**Team members:** {members}",
-        "",
-        "## Temporal Originality",
-    ]
-
-    if report.temporal is None:
-        lines.append("Temporal analysis was not available for this repository.")
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        f"# {report.team} - {report.overall_flag.upper()}\n"
+        "\n"
+        f"**Repo:** {report.repo_url}\n"
+        f"**Devpost:** {devpost_title} | Track: {devpost_track}\n"
+        f"**Team members:** {members}\n"
+        "\n"
+        "## Temporal Originality\n"
+    )
+
+    temporal = report.temporal
+    if temporal is None:
+        write("Temporal analysis was not available for this repository.\n")
     else:
-        lines.extend(
-            [
-                f"- Commits analyzed: {report.temporal.total_commits}",
-                (
-                    "- Commit timing: "
-                    f"pre-window={report.temporal.pre_window}, "
-                    f"in-window={report.temporal.in_window}, "
-                    f"post-window={report.temporal.post_window}"
-                ),
-                f"- Pre-window percentage: {report.temporal.pre_window_pct:.1f}%",
-                f"- Risk flag: {report.temporal.risk_flag}",
-                f"- Reason: {report.temporal.risk_reason}",
-            ]
+        write(
+            f"- Commits analyzed: {temporal.total_commits}\n"
+            "- Commit timing: "
+            f"pre-window={temporal.pre_window}, "
+            f"in-window={temporal.in_window}, "
+            f"post-window={temporal.post_window}\n"
+            f"- Pre-window percentage: {temporal.pre_window_pct:.1f}%\n"
+            f"- Risk flag: {temporal.risk_flag}\n"
+            f"- Reason: {temporal.risk_reason}\n"
         )
 
-    lines.extend(["", "## GenAI Signals"])
+    write("\n## GenAI Signals\n")
+    _write_signals(write, getattr(report.genai, "genai_signals", []) if report.genai else [])
 
-    genai_signals = list(getattr(report.genai, "genai_signals", [])) if report.genai else []
-    if genai_signals:
-        for signal in genai_signals:
-            lines.append(f"- {signal.name}: {signal.description}")
-    else:
-        lines.append("None detected.")
+    write("\n## Human Engagement\n")
+    _write_signals(write, getattr(report.genai, "human_signals", []) if report.genai else [])
 
-    lines.extend(["", "## Human Engagement"])
+    write(f"\n## Summary\n{report.overall_reason}\n")
+    return buf.getvalue()
 
-    human_signals = list(getattr(report.genai, "human_signals", [])) if report.genai else []
-    if human_signals:
-        for signal in human_signals:
-            lines.append(f"- {signal.name}: {signal.description}")
-    else:
-        lines.append("None detected.")
 
-    lines.extend(["", "## Summary", report.overall_reason, ""])
-    return "\n".join(lines)
+def _write_signals(write: Callable[[str], Any], signals: Iterable[Any]) -> None:
+    wrote_any = False
+    for signal in signals:
+        write(f"- {signal.name}: {signal.description}\n")
+        wrote_any = True
+    if not wrote_any:
+        write("None detected.\n")
 
 
 def render_index(reports: list[TeamReport]) -> str:
-    severity_rank = {"flagged": 0, "review-recommended": 1, "clean": 2}
     ordered = sorted(
         reports,
-        key=lambda report: (severity_rank.get(report.overall_flag, 99), report.team.lower()),
+        key=lambda report: (_SEVERITY_RANK.get(report.overall_flag, 99), report.team.lower()),
+    )
+
+    rows = [_index_row(report) for report in ordered]
+    return (
+        "# Submission Originality Summary\n"
+        "\n"
+        "| Team | Flag | Temporal Risk | Pre-window % | GenAI Signals |\n"
+        "|---|---|---|---:|---:|\n"
+        + "".join(rows)
     )
 
-    lines = [
-        "# Submission Originality Summary",
-        "",
-        "| Team | Flag | Temporal Risk | Pre-window % | GenAI Signals |",
-        "|---|---|---|---:|---:|",
-    ]
-
-    for report in ordered:
-        temporal_risk = report.temporal.risk_flag if report.temporal else "n/a"
-        pre_window_pct = f"{report.temporal.pre_window_pct:.1f}%" if report.temporal else "n/a"
-        genai_count = len(getattr(report.genai, "genai_signals", [])) if report.genai else 0
-        lines.append(
-            "| "
-            f"{report.team} | {report.overall_flag} | {temporal_risk} | {pre_window_pct} | {genai_count} "
-            "|"
-        )
 
-    lines.append("")
-    return "\n".join(lines)
+def _index_row(report: TeamReport) -> str:
+    temporal_risk = report.temporal.risk_flag if report.temporal else "n/a"
+    pre_window_pct = f"{report.temporal.pre_window_pct:.1f}%" if report.temporal else "n/a"
+    genai_count = len(getattr(report.genai, "genai_signals", [])) if report.genai else 0
+    return (
+        "| "
+        f"{report.team} | {report.overall_flag} | {temporal_risk} | {pre_window_pct} | {genai_count} "
+        "|\n"
+    )
 
 
 def write_reports(output_dir: Path, reports: list[TeamReport]) -> list[Path]:
     output_dir.mkdir(parents=True, exist_ok=True)
-    written: list[Path] = []
+    written = [output_dir / f"{_slugify(report.team)}.md" for report in reports]
 
-    for report in reports:
-        slug = _slugify(report.team)
-        report_path = output_dir / f"{slug}.md"
-        report_path.write_text(render_team_report(report), encoding="utf-8")
-        written.append(report_path)
+    # Teams that slug to the same file keep the last report, as sequential
+    # writes did; each distinct file is then written exactly once.
+    latest = dict(zip(written, reports))
+    pending = [(path, render_team_report(report)) for path, report in latest.items()]
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        list(executor.map(_write_text, pending))
 
     index_path = output_dir / "index.md"
     index_path.write_text(render_index(reports), encoding="utf-8")
@@ -204,7 +208,10 @@ def write_reports(output_dir: Path, reports: list[TeamReport]) -> list[Path]:
     return written
 
 
+def _write_text(item: tuple[Path, str]) -> None:
+    path, text = item
+    path.write_text(text, encoding="utf-8")
+
+
 def _slugify(value: str) -> str:
-    cleaned = "".join(ch.lower() if ch.isalnum() else "-" for ch in value.strip())
-    squashed = "-".join(part for part in cleaned.split("-") if part)
-    return squashed or "team-report"
+    return _SLUG_SEPARATOR_RE.sub("-", value).strip("-").lower() or "team-report"
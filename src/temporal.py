@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Literal
+from functools import lru_cache
+from typing import Iterable, Literal
 from zoneinfo import ZoneInfo
 
 from src.config import HackathonWindow
@@ -28,64 +29,84 @@ class TemporalReport:
 
 
 def classify_commit(commit: Commit, window: HackathonWindow) -> Period:
-    start_dt, end_dt = parse_hackathon_window(window)
-    commit_dt = _parse_datetime(commit.timestamp).astimezone(start_dt.tzinfo)
-
-    if commit_dt < start_dt:
-        return "pre"
-    if commit_dt > end_dt:
-        return "post"
-    return "in"
+    return classify_all([commit], window)[0]
 
 
-def analyze_repo(result: IngestResult, window: HackathonWindow) -> TemporalReport:
+def classify_all(commits: Iterable[Commit], window: HackathonWindow) -> list[Period]:
     start_dt, end_dt = parse_hackathon_window(window)
+    tz = start_dt.tzinfo
+    periods: list[Period] = []
+    for commit in commits:
+        commit_dt = _parse_datetime(commit.timestamp).astimezone(tz)
+        if commit_dt < start_dt:
+            periods.append("pre")
+        elif commit_dt > end_dt:
+            periods.append("post")
+        else:
+            periods.append("in")
+    return periods
 
-    pre_commits: list[Commit] = []
-    in_commits: list[Commit] = []
-    post_commits: list[Commit] = []
 
+def analyze_repo(result: IngestResult, window: HackathonWindow) -> TemporalReport:
+    accumulator = TemporalAccumulator(window)
     for commit in result.commits:
-        commit_dt = _parse_datetime(commit.timestamp).astimezone(start_dt.tzinfo)
-        if commit_dt < start_dt:
-            pre_commits.append(commit)
-        elif commit_dt > end_dt:
-            post_commits.append(commit)
+        accumulator.add(commit)
+    return accumulator.finish(result)
+
+
+class TemporalAccumulator:
+    """Running pre/in/post tallies, fed one commit at a time (e.g. while ingesting)."""
+
+    def __init__(self, window: HackathonWindow) -> None:
+        self._start_dt, self._end_dt = parse_hackathon_window(window)
+        self._tz = self._start_dt.tzinfo
+        self.total_commits = 0
+        self.pre_window = 0
+        self.in_window = 0
+        self.post_window = 0
+        self.largest_pre_commit: Commit | None = None
+        self._largest_pre_size = -1
+        self.first_in_window_commit: Commit | None = None
+        self._first_in_dt: datetime | None = None
+
+    def add(self, commit: Commit) -> None:
+        commit_dt = _parse_datetime(commit.timestamp).astimezone(self._tz)
+        self.total_commits += 1
+        if commit_dt < self._start_dt:
+            self.pre_window += 1
+            size = len(commit.files_changed)
+            if size > self._largest_pre_size:
+                self.largest_pre_commit, self._largest_pre_size = commit, size
+        elif commit_dt > self._end_dt:
+            self.post_window += 1
         else:
-            in_commits.append(commit)
-
-    total_commits = len(result.commits)
-    pre_window = len(pre_commits)
-    in_window = len(in_commits)
-    post_window = len(post_commits)
-    pre_window_pct = (pre_window / total_commits * 100.0) if total_commits else 0.0
-
-    largest_pre_commit = (
-        max(pre_commits, key=lambda commit: len(commit.files_changed)) if pre_commits else None
-    )
-    first_in_window_commit = (
-        min(in_commits, key=lambda commit: _parse_datetime(commit.timestamp))
-        if in_commits
-        else None
-    )
-
-    risk_flag, risk_reason = _derive_risk(pre_window_pct, largest_pre_commit, total_commits)
-
-    return TemporalReport(
-        team=result.spec.team,
-        repo_url=result.spec.repo_url,
-        total_commits=total_commits,
-        pre_window=pre_window,
-        in_window=in_window,
-        post_window=post_window,
-        pre_window_pct=pre_window_pct,
-        largest_pre_commit=largest_pre_commit,
-        first_in_window_commit=first_in_window_commit,
-        risk_flag=risk_flag,
-        risk_reason=risk_reason,
-    )
+            self.in_window += 1
+            if self._first_in_dt is None or commit_dt < self._first_in_dt:
+                self.first_in_window_commit, self._first_in_dt = commit, commit_dt
+
+    def finish(self, result: IngestResult) -> TemporalReport:
+        total_commits = self.total_commits
+        pre_window_pct = (self.pre_window / total_commits * 100.0) if total_commits else 0.0
+        risk_flag, risk_reason = _derive_risk(
+            pre_window_pct, self.largest_pre_commit, total_commits
+        )
+
+        return TemporalReport(
+            team=result.spec.team,
+            repo_url=result.spec.repo_url,
+            total_commits=total_commits,
+            pre_window=self.pre_window,
+            in_window=self.in_window,
+            post_window=self.post_window,
+            pre_window_pct=pre_window_pct,
+            largest_pre_commit=self.largest_pre_commit,
+            first_in_window_commit=self.first_in_window_commit,
+            risk_flag=risk_flag,
+            risk_reason=risk_reason,
+        )
 
 
+@lru_cache(maxsize=16)
 def parse_hackathon_window(window: HackathonWindow) -> tuple[datetime, datetime]:
     tz = ZoneInfo(window.timezone)
     start_dt = _parse_datetime(window.start_datetime, default_tz=tz).astimezone(tz)
@@ -96,7 +117,7 @@ def parse_hackathon_window(window: HackathonWindow) -> tuple[datetime, datetime]
 
 
 def _parse_datetime(raw_value: str, default_tz: ZoneInfo | None = None) -> datetime:
-    dt = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+    dt = datetime.fromisoformat(raw_value)
     if dt.tzinfo is None:
         tz = default_tz or timezone.utc
         return dt.replace(tzinfo=tz)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pytest
+
+from src.ingest import clear_ingest_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ingest_cache():
+    # The ingest cache is process-wide; reset it so results never depend on
+    # which tests ran earlier in the same worker.
+    clear_ingest_cache()
+    yield
+    clear_ingest_cache()
@@ -37,7 +37,28 @@ def test_load_submissions_handles_missing_fields_gracefully() -> None:
     assert item.submitted_at is None
 
 
-def test_load_submissions_from_devpost_url(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_submissions_reparses_when_file_changes(tmp_path: Path) -> None:
+    csv_path = tmp_path / "submissions.csv"
+    csv_path.write_text("Project Title\nFirst\n", encoding="utf-8")
+
+    assert [item.title for item in load_submissions(csv_path)] == ["First"]
+    assert [item.title for item in load_submissions(csv_path)] == ["First"]
+
+    csv_path.write_text("Project Title\nSecond one\n", encoding="utf-8")
+
+    assert [item.title for item in load_submissions(csv_path)] == ["Second one"]
+
+
+@pytest.mark.parametrize("html_parser", ["selectolax", "regex"])
+def test_load_submissions_from_devpost_url(
+    monkeypatch: pytest.MonkeyPatch,
+    html_parser: str,
+) -> None:
+    if html_parser == "selectolax":
+        pytest.importorskip("selectolax")
+    else:
+        monkeypatch.setattr("src.devpost.HTMLParser", None)
+
     fixture_html = Path("tests/fixtures/devpost_project.html").read_text(encoding="utf-8")
 
     class Response:
@@ -47,12 +68,12 @@ def test_load_submissions_from_devpost_url(monkeypatch: pytest.MonkeyPatch) -> N
         def raise_for_status(self) -> None:
             return
 
-    def fake_get(url: str, timeout: int = 30) -> Response:
+    def fake_get(session, url: str, timeout: int = 30) -> Response:
         assert url == "https://devpost.com/software/transit-hero"
         assert timeout == 30
         return Response()
 
-    monkeypatch.setattr("src.devpost.requests.get", fake_get)
+    monkeypatch.setattr("src.devpost.requests.Session.get", fake_get)
 
     submissions = load_submissions("https://devpost.com/software/transit-hero")
     assert len(submissions) == 1
@@ -17,7 +17,7 @@ def _commit(
         email=f"{author.lower()}@example.com",
         timestamp=timestamp,
         message=message,
-        files_changed=files_changed,
+        files_changed=tuple(files_changed),
     )
 
 
@@ -1,9 +1,73 @@
 from __future__ import annotations
 
+import io
+import os
+import shutil
+import subprocess
 from types import SimpleNamespace
 
-from src.ingest import ingest_repo, parse_repo_url
-from src.models import RepoSpec
+import pytest
+
+from src.config import HackathonWindow
+from src.ingest import (
+    clear_ingest_cache,
+    ingest_and_analyze,
+    ingest_many,
+    ingest_repo,
+    parse_repo_url,
+)
+from src.models import IngestResult, RepoSpec
+from src.temporal import analyze_repo
+
+SHA_A, SHA_B, SHA_C = ("a" * 40, "b" * 40, "c" * 40)
+SPEC = RepoSpec(team="Team A", repo_url="https://github.com/org/repo")
+
+WINDOW = HackathonWindow(
+    start_datetime="2026-02-20T09:00:00",
+    end_datetime="2026-02-22T17:00:00",
+    timezone="America/New_York",
+)
+
+
+def _git_ok(calls: list | None = None):
+    def fake_run(cmd, check, capture_output):
+        if calls is not None:
+            calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+    return fake_run
+
+
+def _subcommand(cmd: list[str]) -> str:
+    args = iter(cmd[1:])
+    for arg in args:
+        if arg in ("-C", "-c"):
+            next(args)
+        else:
+            return arg
+    return ""
+
+
+def _fake_popen(
+    calls: list,
+    output: str | bytes = "",
+    returncode: int = 0,
+    error_output: str = "",
+):
+    class FakePopen:
+        def __init__(self, cmd, stdout, stderr, **kwargs) -> None:
+            calls.append(cmd)
+            self.stdout = io.BytesIO(output if isinstance(output, bytes) else output.encode("utf-8"))
+            self.returncode = returncode
+            stderr.write(error_output.encode("utf-8"))
+
+        def __enter__(self) -> FakePopen:
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+    return FakePopen
 
 
 def test_parse_github_url() -> None:
@@ -25,46 +89,461 @@ def test_parse_gitlab_url() -> None:
 def test_successful_clone_parses_commits(monkeypatch) -> None:
     calls = []
 
-    def fake_run(cmd, check, capture_output, text):
+    def fake_run(cmd, check, capture_output):
         calls.append(cmd)
         if cmd[0:3] == ["git", "clone", "--bare"]:
-            return SimpleNamespace(returncode=0, stdout="", stderr="")
-        if cmd[0] == "git" and "log" in cmd:
-            output = (
-                "abc123\x00Alice\x00alice@example.com\x002026-02-01T10:00:00+00:00\x00Init\n"
-                "README.md\n"
-                "src/app.py\n\n"
-                "def456\x00Bob\x00bob@example.com\x002026-02-02T11:30:00+00:00\x00Update docs\n"
-                "docs/guide.md\n"
-            )
-            return SimpleNamespace(returncode=0, stdout=output, stderr="")
+            return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
         raise AssertionError(f"unexpected command: {cmd}")
 
+    output = (
+        f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00+00:00\x00Init\n"
+        "README.md\x00src/app.py\x00\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-02T11:30:00+00:00\x00Update docs\n"
+        "docs/guide.md\x00"
+    )
     monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls, output))
 
-    spec = RepoSpec(team="Team A", repo_url="https://github.com/org/repo")
-    result = ingest_repo(spec, github_token="ghp_secret_token")
+    result = ingest_repo(SPEC, github_token="ghp_secret_token")
 
     assert not result.errors
     assert len(result.commits) == 2
-    assert result.commits[0].sha == "abc123"
-    assert result.commits[0].files_changed == ["README.md", "src/app.py"]
+    assert result.commits[0].sha == SHA_A
+    assert result.commits[0].files_changed == ("README.md", "src/app.py")
     assert result.commits[1].message == "Update docs"
     assert result.commits[1].timestamp == "2026-02-02T11:30:00Z"
 
     clone_cmd = calls[0]
     assert clone_cmd[0:3] == ["git", "clone", "--bare"]
-    assert "ghp_secret_token@github.com" in clone_cmd[3]
+    assert "--filter=blob:none" in clone_cmd
+    assert "ghp_secret_token@github.com" in clone_cmd[-2]
+
+
+def test_ingest_without_files_skips_name_only(monkeypatch) -> None:
+    calls = []
+
+    output = (
+        f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00+00:00\x00Init\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-02T11:30:00+00:00\x00Empty"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok(calls))
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls, output))
+
+    result = ingest_repo(SPEC, include_files=False)
+
+    assert "--name-only" not in calls[-1]
+    assert [commit.sha for commit in result.commits] == [SHA_A, SHA_B]
+    assert all(commit.files_changed == () for commit in result.commits)
+
+
+def test_log_records_keep_unusual_paths_and_empty_commits(monkeypatch) -> None:
+    output = (
+        f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00Z\x00Add\n"
+        "caf\u00e9.txt\x00line\nbreak.txt\x00\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-01T11:00:00Z\x00Empty\x00"
+        f"{SHA_C}\x00Cy\x00cy@example.com\x002026-02-01T12:00:00Z\x00Root\n"
+        "README.md\x00"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result = ingest_repo(SPEC)
+
+    assert [commit.files_changed for commit in result.commits] == [
+        ("caf\u00e9.txt", "line\nbreak.txt"),
+        (),
+        ("README.md",),
+    ]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_pygit2_walk_matches_git_log(monkeypatch, tmp_path) -> None:
+    pytest.importorskip("pygit2")
+    work = tmp_path / "work"
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Alice",
+        "GIT_AUTHOR_EMAIL": "alice@example.com",
+        "GIT_COMMITTER_NAME": "Alice",
+        "GIT_COMMITTER_EMAIL": "alice@example.com",
+    }
+
+    def git(*args: str, date: str = "2026-02-20T10:00:00+05:30") -> None:
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+        subprocess.run(["git", "-C", str(work), *args], check=True, capture_output=True, env=env)
+
+    work.mkdir()
+    git("init", "-q")
+    (work / "big.txt").write_text("\n".join(str(i) for i in range(50)))
+    (work / "a.txt").write_text("a")
+    git("add", "-A")
+    git("commit", "-q", "-m", "root\ncontinued\n\nbody")
+    git("mv", "big.txt", "moved.txt")
+    git("rm", "-q", "a.txt")
+    git("commit", "-q", "-m", "rename and delete", date="2026-02-21T10:00:00Z")
+    git("mv", "moved.txt", "edited.txt")
+    (work / "edited.txt").write_text("\n".join(str(i) for i in range(51)))
+    git("commit", "-q", "-am", "rename with edit", date="2026-02-21T12:00:00Z")
+    git("commit", "-q", "--allow-empty", "-m", "empty", date="2026-02-22T10:00:00-08:00")
+    (work / "rs.txt").write_text("rs")
+    git("add", "rs.txt")
+    git("commit", "-q", "-m", "sub\x1ewith RS\tand tab", date="2026-02-22T11:00:00Z")
+    git("commit", "-q", "--allow-empty", "-m", "ctrl end\x1f", date="2026-02-22T12:00:00Z")
+    git("commit", "-q", "--allow-empty", "-m", "nbsp end\xa0", date="2026-02-22T13:00:00Z")
+
+    spec = RepoSpec(team="Team A", repo_url=work.as_uri())
+    via_pygit2 = ingest_repo(spec)
+    monkeypatch.setattr("src.ingest.pygit2", None)
+    clear_ingest_cache()
+    via_git_log = ingest_repo(spec)
+
+    assert not via_pygit2.errors
+    assert via_pygit2.commits == via_git_log.commits
+    assert [(c.message, c.files_changed) for c in via_pygit2.commits] == [
+        ("nbsp end\xa0", ()),
+        ("ctrl end\x1f", ()),
+        ("sub\x1ewith RS\tand tab", ("rs.txt",)),
+        ("empty", ()),
+        ("rename with edit", ("edited.txt", "moved.txt")),
+        ("rename and delete", ("a.txt", "moved.txt")),
+        ("root continued", ("a.txt", "big.txt")),
+    ]
+
+
+def test_undecodable_log_bytes_are_replaced_per_field(monkeypatch) -> None:
+    output = (
+        SHA_A.encode() + b"\x00Jos\xe9\x00jose@example.com\x002026-02-01T10:00:00Z\x00Fix\n"
+        b"bad\xff.txt\x00win\r\n.txt\x00"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result = ingest_repo(SPEC)
+
+    [commit] = result.commits
+    assert commit.author == "Jos\ufffd"
+    assert commit.message == "Fix"
+    assert commit.files_changed == ("bad\ufffd.txt", "win\r\n.txt")
+
+
+def test_commit_timestamps_are_normalized_to_utc(monkeypatch) -> None:
+    output = (
+        f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00-05:00\x00East\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-01T10:00:00Z\x00Utc\x00"
+        f"{SHA_C}\x00Cy\x00cy@example.com\x00not-a-date\x00Raw"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result = ingest_repo(SPEC)
+
+    assert [(commit.sha, commit.timestamp) for commit in result.commits] == [
+        (SHA_A, "2026-02-01T15:00:00Z"),
+        (SHA_B, "2026-02-01T10:00:00Z"),
+    ]
+    assert result.warnings == [
+        "Skipped 1 unreadable commit record(s) in https://github.com/org/repo; "
+        "commit counts for this repo may be incomplete"
+    ]
+
+
+def test_sha256_object_ids_are_accepted(monkeypatch) -> None:
+    sha256 = "d" * 64
+    output = (
+        f"{sha256}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00Z\x00Init\n"
+        "README.md\x00\x00"
+        f"{SHA_A}\x00Bob\x00bob@example.com\x002026-02-01T11:00:00Z\x00Sha1\x00"
+        f"{'e' * 50}\x00Cy\x00cy@example.com\x002026-02-01T12:00:00Z\x00Truncated"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result = ingest_repo(SPEC)
+
+    assert [(commit.sha, commit.files_changed) for commit in result.commits] == [
+        (sha256, ("README.md",)),
+        (SHA_A, ()),
+    ]
+    assert len(result.warnings) == 1
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_sha256_repo_is_ingested_by_git_log(monkeypatch, tmp_path) -> None:
+    env = {**os.environ, "GIT_AUTHOR_NAME": "A", "GIT_AUTHOR_EMAIL": "a@example.com"}
+    env.update(GIT_COMMITTER_NAME="A", GIT_COMMITTER_EMAIL="a@example.com")
+    init = subprocess.run(
+        ["git", "init", "-q", "--object-format=sha256", str(tmp_path)], capture_output=True
+    )
+    if init.returncode != 0:
+        pytest.skip("git without sha256 repository support")
+    for message in ("one", "two"):
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "commit", "-q", "--allow-empty", "-m", message],
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+    monkeypatch.setattr("src.ingest.pygit2", None)
+
+    result = ingest_repo(RepoSpec(team="Team A", repo_url=tmp_path.as_uri()))
+
+    assert not result.errors and not result.warnings
+    assert [commit.message for commit in result.commits] == ["two", "one"]
+    assert all(len(commit.sha) == 64 for commit in result.commits)
+
+
+def test_record_separator_in_subject_cannot_forge_commits(monkeypatch) -> None:
+    output = (
+        f"{SHA_A}\x00Mallory\x00m@example.com\x002026-02-18T12:00:00Z\x00innocent\x1ey\n"
+        "f1\x00f2\x00f3\x00f4\x00\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-21T12:00:00Z\x00During\n"
+        "src/c.py\x00"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result, report = ingest_and_analyze(SPEC, WINDOW)
+
+    assert [(c.sha, c.message, c.files_changed) for c in result.commits] == [
+        (SHA_A, "innocent\x1ey", ("f1", "f2", "f3", "f4")),
+        (SHA_B, "During", ("src/c.py",)),
+    ]
+    assert report.largest_pre_commit == result.commits[0]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_cache_dir_reuses_clone_with_fetch(monkeypatch, tmp_path) -> None:
+    secret = "ghp_secret_token"
+    token_url = f"https://{secret}@github.com/org/repo.git"
+    # The stand-in remote's path embeds the token, so any copy of the fetch
+    # URL that git persists would show up in the cached clone's config.
+    upstream = tmp_path / secret / "upstream"
+    cache_dir = tmp_path / "cache"
+    env = {**os.environ, "GIT_AUTHOR_NAME": "A", "GIT_AUTHOR_EMAIL": "a@example.com"}
+    env.update(GIT_COMMITTER_NAME="A", GIT_COMMITTER_EMAIL="a@example.com")
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", "-C", str(upstream), *args], check=True, capture_output=True, env=env)
+
+    upstream.mkdir(parents=True)
+    git("init", "-q", "-b", "main")
+    git("config", "uploadpack.allowFilter", "true")
+    git("commit", "-q", "--allow-empty", "-m", "first")
+
+    calls = []
+    real_popen = subprocess.Popen
+
+    def redirecting_popen(cmd: list[str], **kwargs):
+        # subprocess.run goes through Popen too, so this sees every command.
+        if cmd[:3] != ["git", "-C", str(upstream)]:
+            calls.append(cmd)
+        return real_popen([arg.replace(token_url, upstream.as_uri()) for arg in cmd], **kwargs)
+
+    monkeypatch.setattr("src.ingest.pygit2", None)
+    monkeypatch.setattr("src.ingest.subprocess.Popen", redirecting_popen)
+
+    first = ingest_repo(SPEC, github_token=secret, cache_dir=cache_dir)
+    git("commit", "-q", "--allow-empty", "-m", "second")
+    clear_ingest_cache()
+    second = ingest_repo(SPEC, github_token=secret, cache_dir=cache_dir)
+
+    assert not first.errors and not second.errors
+    assert [c.message for c in second.commits] == ["second", "first"]
+    assert [_subcommand(cmd) for cmd in calls] == [
+        "clone",
+        "remote",
+        "commit-graph",
+        "log",
+        "symbolic-ref",
+        "fetch",
+        "commit-graph",
+        "log",
+    ]
+    assert calls[1][-1] == "https://github.com/org/repo"
+    assert calls[5][-2:] == ["origin", "+HEAD:refs/heads/main"]
+    [cached] = cache_dir.iterdir()
+    assert secret not in (cached / "config").read_text()
+
+
+def test_clone_retries_without_filter_when_partial_clone_is_refused(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(cmd, check, capture_output):
+        calls.append(cmd)
+        if "--filter=blob:none" in cmd:
+            return SimpleNamespace(
+                returncode=128,
+                stdout=b"",
+                stderr=b"fatal: remote error: filter 'blob:none' not supported",
+            )
+        return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls))
+
+    result = ingest_repo(SPEC)
+
+    assert not result.errors
+    assert calls[1][0:3] == ["git", "clone", "--bare"]
+    assert "--filter=blob:none" not in calls[1]
+
+
+def test_clone_failure_mentioning_filter_elsewhere_is_not_retried(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(cmd, check, capture_output):
+        calls.append(cmd)
+        return SimpleNamespace(
+            returncode=128,
+            stdout=b"",
+            stderr=b"fatal: repository 'https://github.com/org/filter-app/' not found",
+        )
+
+    monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
+
+    spec = RepoSpec(team="Team A", repo_url="https://github.com/org/filter-app")
+    result = ingest_repo(spec)
+
+    assert result.errors
+    assert len(calls) == 1
+
+
+def test_duplicate_repo_urls_are_ingested_once(monkeypatch) -> None:
+    calls = []
+
+    output = f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-01T10:00:00Z\x00Init\nREADME.md\x00"
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok(calls))
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls, output))
+
+    specs = [
+        SPEC,
+        RepoSpec(team="Team A (resubmitted)", repo_url="https://github.com/org/repo"),
+    ]
+    results = ingest_many(specs, max_workers=2)
+    other_token = ingest_repo(specs[0], github_token="ghp_other")
+
+    clones = [cmd for cmd in calls if cmd[0:3] == ["git", "clone", "--bare"]]
+    assert len(clones) == 2
+    assert [result.spec for result in results] == specs
+    assert results[0].commits == results[1].commits == other_token.commits
+    assert results[0].commits is not results[1].commits
+
+
+def test_workdir_clones_are_left_for_the_caller(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def fake_run(cmd, check, capture_output):
+        calls.append(cmd)
+        if cmd[0:3] == ["git", "clone", "--bare"]:
+            os.makedirs(cmd[-1])
+        return SimpleNamespace(returncode=0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls))
+
+    specs = [
+        RepoSpec(team="Team A", repo_url="https://github.com/org/repo-a"),
+        RepoSpec(team="Team B", repo_url="https://github.com/org/repo-b"),
+    ]
+    ingest_many(specs, workdir=tmp_path)
+
+    clone_dirs = [cmd[-1] for cmd in calls if cmd[0:3] == ["git", "clone", "--bare"]]
+    assert len(set(clone_dirs)) == 2
+    assert all(os.path.dirname(path) == str(tmp_path) for path in clone_dirs)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_workdir_clones_drop_the_token_from_origin(monkeypatch, tmp_path) -> None:
+    calls = []
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok(calls))
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen(calls))
+
+    ingest_repo(SPEC, github_token="ghp_secret_token", workdir=tmp_path)
+
+    [clone_cmd, set_url_cmd] = [cmd for cmd in calls if _subcommand(cmd) in ("clone", "remote")]
+    assert set_url_cmd == [
+        "git",
+        "-C",
+        clone_cmd[-1],
+        "remote",
+        "set-url",
+        "origin",
+        "https://github.com/org/repo",
+    ]
+
+
+def test_log_failure_reports_sanitized_stderr(monkeypatch) -> None:
+    secret = "ghp_log_secret"
+
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr(
+        "src.ingest.subprocess.Popen",
+        _fake_popen([], returncode=128, error_output=f"fatal: bad object for {secret}\n"),
+    )
+
+    result = ingest_repo(SPEC, github_token=secret)
+
+    assert result.commits == []
+    assert result.errors == [
+        "Failed to read commit history for https://github.com/org/repo: fatal: bad object for ***"
+    ]
+
+
+def test_ingest_many_returns_results_in_input_order(monkeypatch) -> None:
+    seen = []
+
+    def fake_ingest_repo(spec, github_token, gitlab_token, include_files, cache_dir, workdir):
+        seen.append((spec.team, github_token, include_files))
+        return IngestResult(spec=spec)
+
+    monkeypatch.setattr("src.ingest.ingest_repo", fake_ingest_repo)
+
+    specs = [RepoSpec(team=f"Team {i}", repo_url=f"https://github.com/org/repo{i}") for i in range(5)]
+    results = ingest_many(specs, max_workers=3, github_token="tok", include_files=False)
+
+    assert [result.spec for result in results] == specs
+    assert sorted(seen) == [(f"Team {i}", "tok", False) for i in range(5)]
+
+
+def test_ingest_and_analyze_matches_separate_analysis(monkeypatch) -> None:
+    output = (
+        f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-18T12:00:00Z\x00Old\nsrc/a.py\x00src/b.py\x00\x00"
+        f"{SHA_B}\x00Bob\x00bob@example.com\x002026-02-21T12:00:00Z\x00During\nsrc/c.py\x00\x00"
+        f"{SHA_C}\x00Cy\x00cy@example.com\x002026-02-23T12:00:00Z\x00After\nREADME.md\x00"
+    )
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr("src.ingest.subprocess.Popen", _fake_popen([], output))
+
+    result, report = ingest_and_analyze(SPEC, WINDOW)
+
+    assert len(result.commits) == 3
+    assert report == analyze_repo(result, WINDOW)
+    assert (report.pre_window, report.in_window, report.post_window) == (1, 1, 1)
+
+
+def test_ingest_and_analyze_discards_commits_from_failed_log(monkeypatch) -> None:
+    output = f"{SHA_A}\x00Alice\x00alice@example.com\x002026-02-18T12:00:00Z\x00Old\x00"
+    monkeypatch.setattr("src.ingest.subprocess.run", _git_ok())
+    monkeypatch.setattr(
+        "src.ingest.subprocess.Popen",
+        _fake_popen([], output, returncode=128, error_output="fatal: truncated"),
+    )
+
+    result, report = ingest_and_analyze(SPEC, WINDOW)
+
+    assert result.errors
+    assert result.commits == []
+    assert report.total_commits == 0
 
 
 def test_clone_failure_redacts_token_in_error(monkeypatch) -> None:
     secret = "ghp_super_secret"
 
-    def fake_run(cmd, check, capture_output, text):
+    def fake_run(cmd, check, capture_output):
         return SimpleNamespace(
             returncode=1,
-            stdout="",
-            stderr=f"fatal: Authentication failed for 'https://{secret}@github.com/org/repo.git'",
+            stdout=b"",
+            stderr=f"fatal: Authentication failed for 'https://{secret}@github.com/org/repo.git'".encode(),
         )
 
     monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
@@ -80,9 +559,9 @@ def test_clone_failure_redacts_token_in_error(monkeypatch) -> None:
 def test_unknown_host_attempts_clone_and_warns_on_failure(monkeypatch) -> None:
     calls = []
 
-    def fake_run(cmd, check, capture_output, text):
+    def fake_run(cmd, check, capture_output):
         calls.append(cmd)
-        return SimpleNamespace(returncode=1, stdout="", stderr="fatal: could not resolve host")
+        return SimpleNamespace(returncode=1, stdout=b"", stderr=b"fatal: could not resolve host")
 
     monkeypatch.setattr("src.ingest.subprocess.run", fake_run)
 
@@ -93,4 +572,4 @@ def test_unknown_host_attempts_clone_and_warns_on_failure(monkeypatch) -> None:
     assert result.warnings
     assert "unknown host" in result.warnings[0].lower()
     assert calls[0][0:3] == ["git", "clone", "--bare"]
-    assert calls[0][3] == "https://example.com/org/repo.git"
+    assert calls[0][-2] == "https://example.com/org/repo.git"
@@ -1,24 +1,40 @@
 from __future__ import annotations
 
+import re
+import sys
+from functools import lru_cache
+from itertools import islice
+
+import pytest
+
 from src.devpost import Submission
 from src.genai_signals import GenAIReport, GenAISignal
 from src.models import Commit, IngestResult, RepoSpec
 from src.report import (
+    TeamReport,
     analyze_genai_optional,
     build_team_report,
     load_genai_analyzer,
     render_index,
     render_team_report,
+    write_reports,
 )
 from src.temporal import TemporalReport
 
+DEFAULT_SPEC = RepoSpec(team="Team One", repo_url="https://github.com/org/repo")
+DEFAULT_INGEST = IngestResult(spec=DEFAULT_SPEC)
 
-def _spec(team: str = "Team One", repo_url: str = "https://github.com/org/repo") -> RepoSpec:
-    return RepoSpec(team=team, repo_url=repo_url)
-
-
-def _ingest(spec: RepoSpec | None = None) -> IngestResult:
-    return IngestResult(spec=spec or _spec())
+REQUIRED_SECTIONS = (
+    "# Team One - REVIEW-RECOMMENDED",
+    "## Temporal Originality",
+    "## GenAI Signals",
+    "## Human Engagement",
+    "## Summary",
+)
+_SECTIONS_RE = re.compile(
+    "".join(f"(?=.*^{re.escape(section)}$)" for section in REQUIRED_SECTIONS),
+    re.DOTALL | re.MULTILINE,
+)
 
 
 def _temporal(
@@ -41,6 +57,7 @@ def _temporal(
     )
 
 
+@lru_cache(maxsize=8)
 def _genai(genai_count: int = 1, human_count: int = 0) -> GenAIReport:
     genai_signals = [
         GenAISignal(name=f"genai_{idx}", description="signal", commits=[f"g{idx}"])
@@ -59,7 +76,22 @@ def _genai(genai_count: int = 1, human_count: int = 0) -> GenAIReport:
     )
 
 
-def _submission() -> Submission:
+def _team_report(team: str, repo_url: str, overall_flag: str, risk_flag: str) -> TeamReport:
+    return TeamReport(
+        team=team,
+        repo_url=repo_url,
+        devpost_title=None,
+        devpost_track=None,
+        devpost_team_members=[],
+        temporal=_temporal(risk_flag),
+        genai=None,
+        overall_flag=overall_flag,
+        overall_reason="reason",
+    )
+
+
+@pytest.fixture(scope="module")
+def default_submission() -> Submission:
     return Submission(
         title="Civic App",
         description="desc",
@@ -71,92 +103,111 @@ def _submission() -> Submission:
     )
 
 
-def test_flagged_when_temporal_risk_is_high() -> None:
-    report = build_team_report(
-        spec=_spec(),
-        ingest_result=_ingest(),
-        temporal=_temporal("high", reason="60% pre-window"),
-        genai=None,
-        submission=_submission(),
+@pytest.fixture(scope="module")
+def team_report(
+    request: pytest.FixtureRequest, default_submission: Submission
+) -> TeamReport:
+    return build_team_report(
+        spec=DEFAULT_SPEC,
+        ingest_result=DEFAULT_INGEST,
+        temporal=_temporal(request.param),
+        # A clean report must hold up with an empty GenAI report, not only without one.
+        genai=_genai(genai_count=0, human_count=0) if request.param == "low" else None,
+        submission=default_submission,
     )
 
-    assert report.overall_flag == "flagged"
-    assert "high" in report.overall_reason.lower()
 
+@pytest.mark.parametrize(
+    "team_report,expected",
+    [("high", "flagged"), ("medium", "review-recommended"), ("low", "clean")],
+    indirect=["team_report"],
+)
+def test_overall_flag_follows_temporal_risk(team_report: TeamReport, expected: str) -> None:
+    assert team_report.overall_flag == expected
+    if expected != "clean":
+        assert team_report.temporal.risk_flag in team_report.overall_reason.lower()
 
-def test_review_recommended_when_temporal_risk_is_medium() -> None:
-    report = build_team_report(
-        spec=_spec(),
-        ingest_result=_ingest(),
+
+def test_render_team_report_includes_expected_sections(default_submission: Submission) -> None:
+    team_report = build_team_report(
+        spec=DEFAULT_SPEC,
+        ingest_result=DEFAULT_INGEST,
         temporal=_temporal("medium", reason="25% pre-window"),
-        genai=None,
-        submission=_submission(),
+        genai=_genai(genai_count=1, human_count=1),
+        submission=default_submission,
     )
 
-    assert report.overall_flag == "review-recommended"
+    markdown = render_team_report(team_report)
 
+    assert _SECTIONS_RE.match(markdown) is not None
 
-def test_clean_when_no_signals() -> None:
-    report = build_team_report(
-        spec=_spec(),
-        ingest_result=_ingest(),
-        temporal=_temporal("low", reason="mostly in-window"),
-        genai=_genai(genai_count=0, human_count=0),
-        submission=_submission(),
-    )
 
-    assert report.overall_flag == "clean"
+def test_render_index_sorts_flagged_first() -> None:
+    flagged = _team_report("Zulu", "https://github.com/org/repo", "flagged", "high")
+    clean = _team_report("Alpha", "https://github.com/org/alpha", "clean", "low")
 
+    index_markdown = render_index([clean, flagged])
 
-def test_render_team_report_includes_expected_sections() -> None:
-    team_report = build_team_report(
-        spec=_spec(),
-        ingest_result=_ingest(),
-        temporal=_temporal("medium", reason="25% pre-window"),
-        genai=_genai(genai_count=1, human_count=1),
-        submission=_submission(),
+    rows = (
+        line
+        for line in index_markdown.splitlines()
+        if line.startswith("| ") and "---" not in line and not line.startswith("| Team |")
     )
+    lines = list(islice(rows, 2))
+    assert lines[0].startswith("| Zulu | flagged")
+    assert lines[1].startswith("| Alpha | clean")
 
-    markdown = render_team_report(team_report)
 
-    assert "# Team One - REVIEW-RECOMMENDED" in markdown
-    assert "## Temporal Originality" in markdown
-    assert "## GenAI Signals" in markdown
-    assert "## Human Engagement" in markdown
-    assert "## Summary" in markdown
+def test_write_reports_uses_slugged_file_names(tmp_path) -> None:
+    reports = [
+        build_team_report(
+            spec=RepoSpec(team=team, repo_url="https://github.com/org/repo"),
+            ingest_result=DEFAULT_INGEST,
+            temporal=_temporal("low"),
+            genai=None,
+            submission=None,
+        )
+        for team in ["  Café Crew! ", "team_42 / v2", "***"]
+    ]
 
+    written = write_reports(tmp_path, reports)
 
-def test_render_index_sorts_flagged_first() -> None:
-    flagged = build_team_report(
-        spec=_spec(team="Zulu"),
-        ingest_result=_ingest(),
-        temporal=_temporal("high"),
+    assert [path.name for path in written] == [
+        "café-crew.md",
+        "team-42-v2.md",
+        "team-report.md",
+        "index.md",
+    ]
+    assert written[0].read_text(encoding="utf-8") == render_team_report(reports[0])
+    assert (tmp_path / "index.md").read_text(encoding="utf-8") == render_index(reports)
+
+
+def test_write_reports_keeps_last_report_for_colliding_slugs(tmp_path) -> None:
+    first = build_team_report(
+        spec=DEFAULT_SPEC,
+        ingest_result=DEFAULT_INGEST,
+        temporal=_temporal("low"),
         genai=None,
         submission=None,
     )
-    clean = build_team_report(
-        spec=_spec(team="Alpha", repo_url="https://github.com/org/alpha"),
-        ingest_result=_ingest(_spec(team="Alpha", repo_url="https://github.com/org/alpha")),
-        temporal=_temporal("low"),
+    second = build_team_report(
+        spec=RepoSpec(team="team-one", repo_url="https://github.com/org/repo"),
+        ingest_result=DEFAULT_INGEST,
+        temporal=_temporal("high"),
         genai=None,
         submission=None,
     )
 
-    index_markdown = render_index([clean, flagged])
+    written = write_reports(tmp_path, [first, second])
 
-    lines = [
-        line
-        for line in index_markdown.splitlines()
-        if line.startswith("| ") and "---" not in line and not line.startswith("| Team |")
-    ]
-    assert lines[0].startswith("| Zulu | flagged")
-    assert lines[1].startswith("| Alpha | clean")
+    assert [path.name for path in written] == ["team-one.md", "team-one.md", "index.md"]
+    assert written[0].read_text(encoding="utf-8") == render_team_report(second)
 
 
 def test_missing_devpost_submission_is_handled() -> None:
     report = build_team_report(
-        spec=_spec(),
-        ingest_result=_ingest(),
+        spec=DEFAULT_SPEC,
+        ingest_result=DEFAULT_INGEST,
         temporal=_temporal("low"),
         genai=None,
         submission=None,
@@ -168,12 +219,7 @@ def test_missing_devpost_submission_is_handled() -> None:
 
 
 def test_missing_genai_module_handled_gracefully(monkeypatch) -> None:
-    def fake_import(name: str):
-        if name == "src.genai_signals":
-            raise ModuleNotFoundError("src.genai_signals")
-        raise AssertionError(f"unexpected module request: {name}")
-
-    monkeypatch.setattr("src.report.import_module", fake_import)
+    monkeypatch.setitem(sys.modules, "src.genai_signals", None)
 
     analyzer, warning = load_genai_analyzer()
     assert analyzer is None
@@ -185,9 +231,9 @@ def test_missing_genai_module_handled_gracefully(monkeypatch) -> None:
         email="alice@example.com",
         timestamp="2026-02-20T14:00:00Z",
         message="init",
-        files_changed=["README.md"],
+        files_changed=("README.md",),
     )
-    result = IngestResult(spec=_spec(), commits=[commit])
+    result = IngestResult(spec=DEFAULT_SPEC, commits=[commit])
     genai_report, warning2 = analyze_genai_optional(result)
 
     assert genai_report is None
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+import pytest
+
 from src.config import HackathonWindow
 from src.models import Commit, IngestResult, RepoSpec
-from src.temporal import analyze_repo, classify_commit
+from src.temporal import analyze_repo, classify_all, classify_commit
+
+WINDOW = HackathonWindow(
+    start_datetime="2026-02-20T09:00:00",
+    end_datetime="2026-02-22T17:00:00",
+    timezone="America/New_York",
+)
 
 
 def _commit(sha: str, timestamp: str, files_changed: int = 1) -> Commit:
@@ -12,16 +22,13 @@ def _commit(sha: str, timestamp: str, files_changed: int = 1) -> Commit:
         email="test@example.com",
         timestamp=timestamp,
         message=f"commit {sha}",
-        files_changed=[f"file_{i}.py" for i in range(files_changed)],
+        files_changed=_files(files_changed),
     )
 
 
-def _window() -> HackathonWindow:
-    return HackathonWindow(
-        start_datetime="2026-02-20T09:00:00",
-        end_datetime="2026-02-22T17:00:00",
-        timezone="America/New_York",
-    )
+@lru_cache(maxsize=64)
+def _files(count: int) -> tuple[str, ...]:
+    return tuple(f"file_{i}.py" for i in range(count))
 
 
 def _ingest(commits: list[Commit]) -> IngestResult:
@@ -32,82 +39,112 @@ def _ingest(commits: list[Commit]) -> IngestResult:
 
 
 def test_classify_commit_pre_in_post() -> None:
-    window = _window()
-
-    pre = _commit("pre", "2026-02-20T13:59:59Z")
-    in_window = _commit("in", "2026-02-20T14:00:00Z")
-    post = _commit("post", "2026-02-22T22:00:01Z")
+    commits = [
+        _commit("pre", "2026-02-20T13:59:59Z"),
+        _commit("in", "2026-02-20T14:00:00Z"),
+        _commit("post", "2026-02-22T22:00:01Z"),
+    ]
 
-    assert classify_commit(pre, window) == "pre"
-    assert classify_commit(in_window, window) == "in"
-    assert classify_commit(post, window) == "post"
+    assert classify_all(commits, WINDOW) == ["pre", "in", "post"]
 
 
 def test_boundary_commit_is_in_window() -> None:
-    window = _window()
-    at_start = _commit("start", "2026-02-20T14:00:00Z")
-    at_end = _commit("end", "2026-02-22T22:00:00Z")
-
-    assert classify_commit(at_start, window) == "in"
-    assert classify_commit(at_end, window) == "in"
-
-
-def test_all_in_window_is_low_risk() -> None:
     commits = [
-        _commit("a", "2026-02-20T14:05:00Z"),
-        _commit("b", "2026-02-21T12:00:00Z"),
+        _commit("start", "2026-02-20T14:00:00Z"),
+        _commit("end", "2026-02-22T22:00:00Z"),
     ]
 
-    report = analyze_repo(_ingest(commits), _window())
-
-    assert report.pre_window == 0
-    assert report.in_window == 2
-    assert report.post_window == 0
-    assert report.pre_window_pct == 0.0
-    assert report.risk_flag == "low"
+    assert classify_all(commits, WINDOW) == ["in", "in"]
 
 
-def test_more_than_half_pre_window_is_high_risk() -> None:
+def test_classify_all_matches_per_commit_classification() -> None:
     commits = [
-        _commit("a", "2026-02-18T12:00:00Z"),
-        _commit("b", "2026-02-19T12:00:00Z"),
-        _commit("c", "2026-02-20T14:30:00Z"),
+        _commit("pre", "2026-02-20T13:59:59Z"),
+        _commit("start", "2026-02-20T14:00:00Z"),
+        _commit("end", "2026-02-22T22:00:00Z"),
+        _commit("post", "2026-02-22T22:00:01Z"),
     ]
 
-    report = analyze_repo(_ingest(commits), _window())
-
-    assert report.pre_window == 2
-    assert report.total_commits == 3
-    assert report.pre_window_pct > 50.0
-    assert report.risk_flag == "high"
-
-
-def test_large_single_pre_window_commit_is_high_risk() -> None:
+    assert classify_all(commits, WINDOW) == ["pre", "in", "in", "post"]
+    assert classify_all(commits, WINDOW) == [classify_commit(c, WINDOW) for c in commits]
+
+
+ANALYZE_CASES = [
+    pytest.param(
+        [
+            _commit("a", "2026-02-20T14:05:00Z"),
+            _commit("b", "2026-02-21T12:00:00Z"),
+        ],
+        dict(pre_window=0, in_window=2, post_window=0, pre_window_pct=0.0, risk_flag="low"),
+        id="all-in-window-is-low-risk",
+    ),
+    pytest.param(
+        [
+            _commit("a", "2026-02-18T12:00:00Z"),
+            _commit("b", "2026-02-19T12:00:00Z"),
+            _commit("c", "2026-02-20T14:30:00Z"),
+        ],
+        dict(
+            total_commits=3,
+            pre_window=2,
+            pre_window_pct=pytest.approx(200 / 3),
+            risk_flag="high",
+        ),
+        id="more-than-half-pre-window-is-high-risk",
+    ),
+    pytest.param(
+        [
+            _commit("a", "2026-02-19T12:00:00Z", files_changed=21),
+            _commit("b", "2026-02-20T15:00:00Z", files_changed=1),
+            _commit("c", "2026-02-21T15:00:00Z", files_changed=1),
+            _commit("d", "2026-02-22T15:00:00Z", files_changed=1),
+            _commit("e", "2026-02-22T16:00:00Z", files_changed=1),
+        ],
+        dict(
+            pre_window=1,
+            pre_window_pct=20.0,
+            largest_pre_commit=_commit("a", "2026-02-19T12:00:00Z", files_changed=21),
+            risk_flag="high",
+        ),
+        id="large-single-pre-window-commit-is-high-risk",
+    ),
+    pytest.param(
+        [],
+        dict(
+            total_commits=0,
+            pre_window=0,
+            in_window=0,
+            post_window=0,
+            pre_window_pct=0.0,
+            largest_pre_commit=None,
+            first_in_window_commit=None,
+            risk_flag="low",
+        ),
+        id="empty-repo-is-low-risk",
+    ),
+]
+
+
+@pytest.mark.parametrize("commits,expected", ANALYZE_CASES)
+def test_analyze_repo_risk(commits: list[Commit], expected: dict[str, object]) -> None:
+    report = analyze_repo(_ingest(commits), WINDOW)
+
+    for field_name, value in expected.items():
+        assert getattr(report, field_name) == value, field_name
+
+
+def test_first_in_window_and_largest_pre_commit_are_selected() -> None:
     commits = [
-        _commit("a", "2026-02-19T12:00:00Z", files_changed=21),
-        _commit("b", "2026-02-20T15:00:00Z", files_changed=1),
-        _commit("c", "2026-02-21T15:00:00Z", files_changed=1),
-        _commit("d", "2026-02-22T15:00:00Z", files_changed=1),
-        _commit("e", "2026-02-22T16:00:00Z", files_changed=1),
+        _commit("late", "2026-02-21T12:00:00Z"),
+        _commit("small", "2026-02-18T12:00:00Z", files_changed=2),
+        _commit("big", "2026-02-19T12:00:00Z", files_changed=5),
+        _commit("tie", "2026-02-19T13:00:00Z", files_changed=5),
+        _commit("early", "2026-02-20T15:00:00Z"),
     ]
 
-    report = analyze_repo(_ingest(commits), _window())
+    report = analyze_repo(_ingest(commits), WINDOW)
 
-    assert report.pre_window == 1
-    assert report.pre_window_pct <= 50.0
     assert report.largest_pre_commit is not None
-    assert len(report.largest_pre_commit.files_changed) == 21
-    assert report.risk_flag == "high"
-
-
-def test_empty_repo_is_low_risk() -> None:
-    report = analyze_repo(_ingest([]), _window())
-
-    assert report.total_commits == 0
-    assert report.pre_window == 0
-    assert report.in_window == 0
-    assert report.post_window == 0
-    assert report.pre_window_pct == 0.0
-    assert report.largest_pre_commit is None
-    assert report.first_in_window_commit is None
-    assert report.risk_flag == "low"
+    assert report.largest_pre_commit.sha == "big"
+    assert report.first_in_window_commit is not None
+    assert report.first_in_window_commit.sha == "early"